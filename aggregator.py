@@ -4,9 +4,9 @@ RSS News Aggregator
 Fetches news from multiple RSS feeds and generates a static HTML website.
 """
 
+import hashlib
 import json
 from datetime import datetime, timedelta, timezone
-from html import escape
 import os
 import re
 from urllib.parse import urlparse
@@ -22,6 +22,7 @@ def sanitize_url(url):
     return ""
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 
 # Get script directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -48,6 +49,7 @@ from reports_fetcher import get_report_fetcher
 from paper_fetcher import fetch_papers, load_papers_cache, save_papers_cache
 from companies_fetcher import fetch_companies, load_companies_cache, save_companies_cache
 from config import (FEED_THREAD_WORKERS, MAX_ARTICLES_PER_FEED,
+                    NEWS_PAGE_SIZE, PAGINATION_WINDOW,
                     NEWS_FRESHNESS_DAYS, TWITTER_FRESHNESS_DAYS,
                     TWITTER_HIGH_SIGNAL_WINDOW_HOURS, TWITTER_HIGH_SIGNAL_TARGET,
                     REPORTS_FRESHNESS_DAYS,
@@ -69,6 +71,49 @@ def _to_iso_datetime(dt):
         return None
 
 
+def build_pagination_html(active_page, total_pages):
+    """Render paginator markup identical to buildPagination() in app.js.
+
+    Used to ship the news tab's first paginator pre-built, so the client
+    skips the window/ellipsis computation on the critical path. The page's
+    PAGINATION_WINDOW boot var gives buildPagination() the same window.
+    """
+    if total_pages <= 1:
+        return ""
+
+    def page_btn(label, page, is_active=False, is_disabled=False, extra_cls=""):
+        cls = "page-btn" + (" active" if is_active else "") + extra_cls
+        if is_disabled:
+            return f'<button class="{cls}" disabled>{label}</button>'
+        if is_active:
+            return f'<button class="{cls}">{label}</button>'
+        return f'<button class="{cls}" data-page="{page}">{label}</button>'
+
+    ellipsis = '<span class="page-ellipsis">\u2026</span>'
+    half = PAGINATION_WINDOW // 2
+    start = max(1, active_page - half)
+    end = min(total_pages, active_page + half)
+    if end - start + 1 < PAGINATION_WINDOW:
+        if start == 1:
+            end = min(total_pages, start + PAGINATION_WINDOW - 1)
+        elif end == total_pages:
+            start = max(1, end - PAGINATION_WINDOW + 1)
+
+    parts = [page_btn("\u2190 Prev", max(1, active_page - 1), False, active_page == 1, " nav prev")]
+    if start > 1:
+        parts.append(page_btn("1", 1, active_page == 1))
+        if start > 2:
+            parts.append(ellipsis)
+    for i in range(start, end + 1):
+        parts.append(page_btn(str(i), i, i == active_page))
+    if end < total_pages:
+        if end < total_pages - 1:
+            parts.append(ellipsis)
+        parts.append(page_btn(str(total_pages), total_pages, active_page == total_pages))
+    parts.append(page_btn("Next \u2192", min(total_pages, active_page + 1), False, active_page == total_pages, " nav next"))
+    return "".join(parts)
+
+
 def _telegram_title_from_text(text):
     """Extract a compact title from Telegram message text."""
     if not text:
@@ -276,6 +321,229 @@ def export_published_snapshot(article_groups, video_articles, twitter_articles,
     )
 
 
+def asset_url(rel_path):
+    """Return rel_path with a ?v=<content hash> cache-buster.
+
+    static/style.min.css is served with a far-future immutable Cache-Control
+    (see _headers), so the URL must change whenever the file does; the
+    templates/* links carry one as well.
+    """
+    try:
+        with open(os.path.join(SCRIPT_DIR, rel_path), "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:10]
+    except OSError:
+        return rel_path
+    return f"{rel_path}?v={digest}"
+
+
+# String literals are matched first so comments/whitespace inside quotes
+# (content: "...", data: URIs) are left untouched.
+_CSS_TOKEN_RE = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*[\s\S]*?\*/|\s+|[^"\'/\s]+|/')
+_CSS_TIGHTEN_RE = re.compile(r"\s*([{};,>])\s*")
+_CSS_AFTER_COLON_RE = re.compile(r":\s+")
+# 0.85rem -> .85rem; skips 10.5, -0.5 and names like .mt-0.5
+_CSS_LEADING_ZERO_RE = re.compile(r"(?<![\w.#-])0(\.\d)")
+
+
+def minify_css(css):
+    """Strip comments and redundant whitespace from a stylesheet.
+
+    Deliberately conservative: whitespace before ':' (descendant pseudo
+    selectors) and around '+'/'-' (calc()) is kept as a single space, and
+    the only value rewrite is dropping the leading zero of decimals.
+    """
+    out = []
+    chunk = []
+
+    def flush():
+        text = "".join(chunk)
+        text = _CSS_TIGHTEN_RE.sub(r"\1", text)
+        text = _CSS_AFTER_COLON_RE.sub(":", text)
+        text = _CSS_LEADING_ZERO_RE.sub(r"\1", text)
+        out.append(text.replace(";}", "}"))
+        chunk.clear()
+
+    for match in _CSS_TOKEN_RE.finditer(css):
+        token = match.group(0)
+        if match.group(1):
+            flush()
+            out.append(token)
+        elif token.startswith("/*"):
+            chunk.append(" ")
+        elif token.isspace():
+            chunk.append(" ")
+        else:
+            chunk.append(token)
+    flush()
+    return "".join(out).strip()
+
+
+def write_if_changed(path, text):
+    """Write text to path unless the file already holds exactly that text.
+
+    Build outputs that did not change keep their bytes and mtime, so the
+    hourly commit and the Pages upload only carry files whose content moved.
+    Returns True when the file was written.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return True
+
+
+def write_minified_css():
+    """Write static/style.min.css from templates/style.css if it changed."""
+    with open(os.path.join(SCRIPT_DIR, "templates", "style.css"), "r", encoding="utf-8") as f:
+        write_if_changed(MINIFIED_CSS_FILE, minify_css(f.read()))
+
+
+# templates/style.css stays the readable source; pages link the minified
+# build unless FINANCERADAR_RAW_CSS is set (handy when debugging styles).
+# The ?v= hash of the source also versions the minified copy.
+MINIFIED_CSS_FILE = os.path.join(SCRIPT_DIR, "static", "style.min.css")
+USE_MINIFIED_CSS = not os.getenv("FINANCERADAR_RAW_CSS")
+STYLE_CSS_URL = asset_url("templates/style.css")
+if USE_MINIFIED_CSS and "?v=" in STYLE_CSS_URL:
+    STYLE_CSS_URL = "static/style.min.css?v=" + STYLE_CSS_URL.split("?v=", 1)[1]
+APP_JS_URL = asset_url("templates/app.js")
+
+# Static <head> markup (no per-build values beyond the asset hash), kept out
+# of generate_html's f-string so it is not re-interpolated on every build.
+# The site stylesheet comes first, ahead of the cross-origin font CSS, and
+# its rel=preload twin is what Cloudflare Pages turns into a 103 Early Hints
+# Link header, so the fetch starts before index.html itself arrives.
+# The font CSS is the only other stylesheet and loads as media="print" until
+# it arrives: with display=swap the fallback faces render either way, and
+# deferred app.js (which reveals the page) no longer waits on fonts.googleapis.com.
+PAGE_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <script data-cfasync="false">try{var t=localStorage.getItem('financeradar_active_tab')||'news';if(localStorage.getItem('financeradar_filters_collapsed_'+t)!=='false')document.documentElement.classList.add('filters-collapsed')}catch(e){}</script>
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Finance Radar</title>
+""" + f"""    <link rel="preload" href="{STYLE_CSS_URL}" as="style">
+    <link rel="stylesheet" href="{STYLE_CSS_URL}">
+""" + """    <link rel="icon" href="static/favicon.svg">
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Fraunces:ital,opsz,wght@0,9..144,300;0,9..144,500;0,9..144,700;0,9..144,900;1,9..144,400;1,9..144,500&family=Nunito+Sans:wght@400;500;600;700&display=swap" rel="stylesheet" media="print" onload="this.media='all'">
+    <link rel="preload" href="static/tab_news.json" as="fetch" crossorigin>
+    <link rel="preload" href="static/tab_telegram.json" as="fetch" crossorigin>
+    <link rel="preload" href="static/tab_youtube.json" as="fetch" crossorigin>
+    <link rel="preload" href="static/tab_research.json" as="fetch" crossorigin>
+    <script data-cfasync="false">
+    window.__preloaded={};
+    ['tab_news','tab_telegram','tab_youtube','tab_research','tab_papers','tab_twitter','tab_twitter_hs','tab_companies','tab_ai_rankings'].forEach(function(k){
+      window.__preloaded[k]=fetch('static/'+k+'.json').then(function(r){return r.json()});
+    });
+    // Reveal body only after data + fonts ready — app.js calls window.__reveal()
+    window.__reveal = function(){
+      document.body.style.transition='opacity 0.3s ease';
+      document.body.style.opacity='1';
+    };
+    // Safety timeout: reveal after 4s no matter what
+    setTimeout(function(){ window.__reveal(); }, 4000);
+    </script>
+</head>
+"""
+
+# Bookmarks panel and WSW sidebar shells: static markup filled in by app.js.
+PAGE_PANELS = """<body>
+    <div class="bk-overlay" id="bk-overlay"></div>
+    <aside id="bk-panel" class="bk-panel">
+        <div class="bk-panel-header">
+            <h3 class="bk-panel-title">Bookmarks</h3>
+            <button class="bk-panel-close" onclick="closeSidebar()">&times;</button>
+        </div>
+        <div class="bk-panel-list" id="bk-list">
+            <p class="bk-empty">No bookmarks yet. Click the bookmark icon on any article to save it.</p>
+        </div>
+        <div class="bk-panel-footer">
+            <button class="bk-action-btn" onclick="copyBookmarks()"><svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><rect x="9" y="9" width="13" height="13" rx="2" ry="2"/><path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"/></svg> <span>Copy All</span></button>
+            <button class="bk-action-btn danger" onclick="clearAllBookmarks()"><svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><polyline points="3 6 5 6 21 6"/><path d="M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6m3 0V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"/></svg> <span>Clear All</span></button>
+        </div>
+    </aside>
+
+    <!-- WSW Sidebar -->
+    <div id="wsw-sidebar-overlay" class="sidebar-overlay">
+      <div class="sidebar">
+        <div class="sidebar-header">
+          <div class="sidebar-title"><span style="font-size:18px;">🗣</span> Who Said What</div>
+          <button class="sidebar-close" onclick="closeWswSidebar()" aria-label="Close">
+            <svg viewBox="0 0 24 24"><line x1="18" y1="6" x2="6" y2="18"></line><line x1="6" y1="6" x2="18" y2="18"></line></svg>
+          </button>
+        </div>
+        <div class="ai-provider-select">
+          <label for="wsw-provider">Model:</label>
+          <select id="wsw-provider" onchange="switchWswProvider()">
+            <option value="">Loading...</option>
+          </select>
+        </div>
+        <div class="wsw-view-switch">
+          <button type="button" class="wsw-view-pill active" data-wsw-view="ideas" onclick="switchWswView('ideas')">Ideas</button>
+          <button type="button" class="wsw-view-pill" data-wsw-view="bookmarks" onclick="switchWswView('bookmarks')">Bookmarks</button>
+        </div>
+        <div id="wsw-content" class="sidebar-content">
+          <div class="sidebar-empty">Loading WSW ideas...</div>
+        </div>
+        <div class="sidebar-footer wsw-footer">
+          <div class="wsw-footer-top">
+            <span id="wsw-updated" class="ai-updated-time">Updated: --</span>
+          </div>
+          <div class="wsw-footer-actions">
+            <button id="wsw-copy-btn" class="sidebar-btn" onclick="copyWswBookmarks()">
+              <svg viewBox="0 0 24 24" width="14" height="14" stroke="currentColor" fill="none" stroke-width="2">
+                <rect x="9" y="9" width="13" height="13" rx="2" ry="2"></rect>
+                <path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"></path>
+              </svg>
+              <span>Copy All</span>
+            </button>
+            <button id="wsw-clear-btn" class="sidebar-btn danger" onclick="clearAllWswBookmarks()">Clear All</button>
+          </div>
+        </div>
+      </div>
+    </div>
+
+"""
+
+# Footer chrome after the build stats, up to the inline globals <script>.
+PAGE_FOOT = """                <button type="button" id="refresh-now" class="refresh-now" hidden>Refresh now</button>
+                <span id="refresh-status" class="refresh-status"></span>
+            </div>
+            <nav class="foot-nav">
+                <a href="/">Feed</a>
+                <a href="about.html">About</a>
+                <a href="mailto:kashish.kapoor@zerodha.com">Contact</a>
+            </nav>
+        </footer>
+    </div>
+
+    <button class="scroll-top" id="scroll-top" aria-label="Back to top">
+        <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round"><polyline points="18 15 12 9 6 15"/></svg>
+    </button>
+
+    <div class="keyboard-hint">
+        <kbd>H</kbd> home &middot; <kbd>1</kbd> <kbd>2</kbd> <kbd>3</kbd> <kbd>4</kbd> <kbd>5</kbd> <kbd>6</kbd> <kbd>7</kbd> tabs &middot; <kbd>J</kbd> <kbd>K</kbd> navigate &middot; <kbd>/</kbd> search
+    </div>
+
+    <script data-cfasync="false">
+"""
+
+# Closes the globals script and loads the versioned app bundle.
+PAGE_CLOSE = f"""
+    </script>
+    <script data-cfasync="false" src="{APP_JS_URL}" defer></script>
+</body>
+</html>
+"""
+
+
 def generate_html(
     article_groups,
     video_articles=None,
@@ -288,14 +556,18 @@ def generate_html(
 ):
     """Generate the static HTML website."""
 
-    # Sort groups by date of primary article (newest first)
-    def get_group_timestamp(group):
-        return get_sort_timestamp(group["primary"])
-
-    groups_with_date = [g for g in article_groups if g["primary"]["date"]]
-    groups_without_date = [g for g in article_groups if not g["primary"]["date"]]
+    # Sort groups by date of primary article (newest first); the timestamp is
+    # computed once per group rather than on every key call.
+    groups_with_date = []
+    groups_without_date = []
+    for g in article_groups:
+        if g["primary"]["date"]:
+            g["_ts"] = get_sort_timestamp(g["primary"])
+            groups_with_date.append(g)
+        else:
+            groups_without_date.append(g)
 
-    groups_with_date.sort(key=get_group_timestamp, reverse=True)
+    groups_with_date.sort(key=itemgetter("_ts"), reverse=True)
     all_sorted_groups = groups_with_date + groups_without_date
 
     # Apply per-feed cap (max 50 articles per feed)
@@ -310,12 +582,11 @@ def generate_html(
             capped_groups.append(group)
             source_counts[source] = count + 1
 
-    # Re-sort after capping
-    capped_groups.sort(key=get_group_timestamp, reverse=True)
+    # Capping only drops groups, so the newest-first order still holds
     sorted_groups = capped_groups
 
-    # Extract flat list of primary articles for counting
-    sorted_articles = [g["primary"] for g in sorted_groups]
+    # One news row per group; counted once for the tab pill, stats bar and log
+    news_count = len(sorted_groups)
 
     # Group by date
     now_ist = datetime.now(IST_TZ)
@@ -323,11 +594,13 @@ def generate_html(
     yesterday = today - timedelta(days=1)
     today_iso = today.isoformat()
 
-    # Get unique sources for filter dropdown
-    sources = sorted(set(a['source'] for a in sorted_articles))
-
     # Get unique publishers for multi-select dropdown
-    all_publishers = sorted(set(a['publisher'] for a in sorted_articles if a.get('publisher')))
+    all_publishers = set()
+    for g in sorted_groups:
+        publisher = g["primary"].get('publisher')
+        if publisher:
+            all_publishers.add(publisher)
+    all_publishers = sorted(all_publishers)
 
     # Publisher presets
     publisher_presets = {
@@ -345,11 +618,7 @@ def generate_html(
         "Macro & Policy": ["Michael Pettis", "Sanjeev Sanyal", "Ila Patnaik", "Ideas For India", "Shruti Rajagopalan", "CareEdge"],
         "Data & Climate": ["Down To Earth", "Carbon Brief", "Ember Energy", "Our World in Data", "Data For India", "IndiaSpend", "India Data Hub"],
     }
-    twitter_presets_json = json.dumps(twitter_presets)
 
-    # JSON for injection into script
-    all_publishers_json = json.dumps(all_publishers)
-    publisher_presets_json = json.dumps(publisher_presets)
 
     # Load Telegram reports if available
     telegram_reports_file = os.path.join(SCRIPT_DIR, "static", "telegram_reports.json")
@@ -361,12 +630,12 @@ def generate_html(
         for _report in telegram_data.get("reports", []):
             if isinstance(_report, dict) and _report.get("channel"):
                 _report["channel"] = _normalize_telegram_channel(_report["channel"])
-        telegram_reports_json = json.dumps(telegram_data.get("reports", []))
+        telegram_reports = telegram_data.get("reports", [])
         telegram_generated_at = telegram_data.get("generated_at", "")
         telegram_warnings = telegram_data.get("warnings", [])
     except (IOError, json.JSONDecodeError):
         telegram_data = {}
-        telegram_reports_json = "[]"
+        telegram_reports = []
         telegram_generated_at = ""
         telegram_warnings = []
 
@@ -376,29 +645,37 @@ def generate_html(
         with open(ai_rankings_file, "r", encoding="utf-8") as f:
             ai_rankings_bootstrap = json.load(f)
         _normalize_ai_rankings_telegram(ai_rankings_bootstrap)
-        ai_rankings_bootstrap_json = json.dumps(ai_rankings_bootstrap)
     except (IOError, json.JSONDecodeError):
-        ai_rankings_bootstrap_json = "null"
+        ai_rankings_bootstrap = None
 
     # Prepare video data
     if video_articles is None:
         video_articles = []
-    video_articles_json = json.dumps([{
-        "title": v["title"],
-        "link": v["link"],
-        "date": v["date"].isoformat() if v.get("date") else None,
-        "source": v.get("source", ""),
-        "publisher": v.get("publisher", ""),
-        "youtube_bucket": v.get("youtube_bucket", ""),
-        "source_url": v.get("source_url", ""),
-        "video_id": v.get("video_id", ""),
-        "thumbnail": v.get("thumbnail", ""),
-    } for v in video_articles])
+    # One pass builds the payload plus the channel and publisher sets
+    video_items = []
+    video_channels = set()
+    youtube_publishers = set()
+    for v in video_articles:
+        publisher = v.get("publisher", "")
+        source = v.get("source", "")
+        video_items.append({
+            "title": v["title"],
+            "link": v["link"],
+            "date": v["date"].isoformat() if v.get("date") else None,
+            "source": source,
+            "publisher": publisher,
+            "youtube_bucket": v.get("youtube_bucket", ""),
+            "source_url": v.get("source_url", ""),
+            "video_id": v.get("video_id", ""),
+            "thumbnail": v.get("thumbnail", ""),
+        })
+        if publisher:
+            video_channels.add(publisher)
+        if publisher or source:
+            youtube_publishers.add(v.get("publisher", source))
     video_count = len(video_articles)
-    video_channel_count = len(set(v.get("publisher", "") for v in video_articles if v.get("publisher")))
-    youtube_publishers = sorted(set(v.get("publisher", v.get("source", "")) for v in video_articles if v.get("publisher") or v.get("source")))
-    youtube_publishers_json = json.dumps(youtube_publishers)
-    youtube_buckets_json = json.dumps(list(YOUTUBE_BUCKETS))
+    video_channel_count = len(video_channels)
+    youtube_publishers = sorted(youtube_publishers)
 
     # Prepare twitter data
     if twitter_articles is None:
@@ -424,40 +701,51 @@ def generate_html(
             "rank_confidence": item.get("rank_confidence", ""),
         }
 
-    twitter_articles_json = json.dumps([_serialize_tweet_item(t) for t in twitter_articles])
-    twitter_high_signal_json = json.dumps([_serialize_tweet_item(t) for t in twitter_high_signal])
-    twitter_lane_meta_json = json.dumps(twitter_lane_meta)
+    twitter_items = [_serialize_tweet_item(t) for t in twitter_articles]
+    twitter_high_signal_items = [_serialize_tweet_item(t) for t in twitter_high_signal]
     twitter_count = len(twitter_articles)
     twitter_high_signal_count = len(twitter_high_signal)
     # Use latest RSSHub tweet date (actual post time), not Google RSS dates (indexing timestamps)
-    _tw_rsshub_dates = [t["date"] for t in twitter_articles if t.get("date") and t.get("source_mode") == "rsshub"]
-    _tw_all_dates = [t["date"] for t in twitter_articles if t.get("date")]
+    _tw_rsshub_dates = []
+    _tw_all_dates = []
+    twitter_publishers = set()
+    for t in twitter_articles:
+        if t.get("date"):
+            _tw_all_dates.append(t["date"])
+            if t.get("source_mode") == "rsshub":
+                _tw_rsshub_dates.append(t["date"])
+        if t.get("publisher") or t.get("source"):
+            twitter_publishers.add(t.get("publisher", t.get("source", "")))
     _tw_dates = _tw_rsshub_dates or _tw_all_dates
     twitter_latest_time = max(_tw_dates).isoformat() if _tw_dates else now_ist.isoformat()
-    twitter_publishers = sorted(set(t.get("publisher", t.get("source", "")) for t in twitter_articles if t.get("publisher") or t.get("source")))
-    twitter_publishers_json = json.dumps(twitter_publishers)
+    twitter_publishers = sorted(twitter_publishers)
 
     # Prepare research reports data
     if report_articles is None:
         report_articles = []
-    research_reports_json = json.dumps([{
-        "title": r["title"],
-        "link": r["link"],
-        "date": r["date"].isoformat() if r.get("date") else None,
-        "source": r.get("source", ""),
-        "publisher": r.get("publisher", ""),
-        "source_url": r.get("source_url", ""),
-        "description": r.get("description", ""),
-        "region": r.get("region", "Indian"),
-    } for r in report_articles])
+    research_items = []
+    research_publishers = set()
+    for r in report_articles:
+        publisher = r.get("publisher", "")
+        research_items.append({
+            "title": r["title"],
+            "link": r["link"],
+            "date": r["date"].isoformat() if r.get("date") else None,
+            "source": r.get("source", ""),
+            "publisher": publisher,
+            "source_url": r.get("source_url", ""),
+            "description": r.get("description", ""),
+            "region": r.get("region", "Indian"),
+        })
+        if publisher:
+            research_publishers.add(publisher)
     research_count = len(report_articles)
-    research_publishers = sorted(set(r.get("publisher", "") for r in report_articles if r.get("publisher")))
-    research_publishers_json = json.dumps(research_publishers)
+    research_publishers = sorted(research_publishers)
 
     # Prepare papers data
     if paper_articles is None:
         paper_articles = []
-    paper_articles_json = json.dumps([{
+    paper_items = [{
         "title": p.get("title", ""),
         "link": p.get("link", ""),
         "date": p["date"].isoformat() if p.get("date") else None,
@@ -467,7 +755,7 @@ def generate_html(
         "description": p.get("description", ""),
         "authors": p.get("authors", ""),
         "date_is_fallback": bool(p.get("date_is_fallback", False)),
-    } for p in paper_articles])
+    } for p in paper_articles]
     paper_count = len(paper_articles)
     paper_source_count = len(
         set(
@@ -480,7 +768,7 @@ def generate_html(
     # Prepare companies data (Tipsheet filings — lightweight, chronological/score-ranked client-side)
     if companies_articles is None:
         companies_articles = []
-    companies_articles_json = json.dumps([{
+    companies_items = [{
         "title": c.get("title", ""),
         "link": c.get("link", ""),
         "date": c["date"].isoformat() if c.get("date") else None,
@@ -492,18 +780,14 @@ def generate_html(
         "cap": c.get("cap", ""),
         "category": c.get("category", ""),
         "score": c.get("score", 0),
-    } for c in companies_articles])
+    } for c in companies_articles]
     companies_count = len(companies_articles)
     # Cap tiers in display order, restricted to those actually present.
     _cap_order = ["Mega cap", "Large cap", "Mid cap", "Small cap", "Micro cap", "Nano cap"]
     _present_caps = set(c.get("cap", "") for c in companies_articles if c.get("cap"))
-    companies_caps_json = json.dumps([t for t in _cap_order if t in _present_caps])
-    companies_categories_json = json.dumps(
-        sorted(set(c.get("category", "") for c in companies_articles if c.get("category")))
-    )
-    companies_sectors_json = json.dumps(
-        sorted(set(c.get("sector", "") for c in companies_articles if c.get("sector")))
-    )
+    companies_caps = [t for t in _cap_order if t in _present_caps]
+    companies_categories = sorted(set(c.get("category", "") for c in companies_articles if c.get("category")))
+    companies_sectors = sorted(set(c.get("sector", "") for c in companies_articles if c.get("sector")))
 
     # Write tab data to separate JSON files for lazy loading
     static_dir = os.path.join(SCRIPT_DIR, "static")
@@ -532,23 +816,30 @@ def generate_html(
 
     _tab_data = {
         "tab_news.json": _news_items,
-        "tab_telegram.json": json.loads(telegram_reports_json),
-        "tab_youtube.json": json.loads(video_articles_json),
-        "tab_twitter.json": json.loads(twitter_articles_json),
-        "tab_twitter_hs.json": json.loads(twitter_high_signal_json),
-        "tab_research.json": json.loads(research_reports_json),
-        "tab_papers.json": json.loads(paper_articles_json),
-        "tab_companies.json": json.loads(companies_articles_json),
-        "tab_ai_rankings.json": json.loads(ai_rankings_bootstrap_json) if ai_rankings_bootstrap_json != "null" else None,
+        "tab_telegram.json": telegram_reports,
+        "tab_youtube.json": video_items,
+        "tab_twitter.json": twitter_items,
+        "tab_twitter_hs.json": twitter_high_signal_items,
+        "tab_research.json": research_items,
+        "tab_papers.json": paper_items,
+        "tab_companies.json": companies_items,
+        "tab_ai_rankings.json": ai_rankings_bootstrap,
     }
     for fname, data in _tab_data.items():
-        fpath = os.path.join(static_dir, fname)
-        with open(fpath, "w", encoding="utf-8") as f:
-            json.dump(data, f, separators=(",", ":"))
+        write_if_changed(os.path.join(static_dir, fname), json.dumps(data, separators=(",", ":")))
 
     # Count in-focus articles (covered by multiple sources)
     in_focus_count = sum(1 for g in sorted_groups if g["related_sources"])
 
+    # First news paginator, pre-rendered on the page setPageToToday() picks
+    news_total_pages = max(1, -(-news_count // NEWS_PAGE_SIZE))
+    news_first_page = 1
+    for idx, item in enumerate(_news_items):
+        if (item["date"] or "")[:10] == today_iso:
+            news_first_page = idx // NEWS_PAGE_SIZE + 1
+            break
+    news_pagination_html = build_pagination_html(news_first_page, news_total_pages)
+
     # Telegram reports stats for tabs
     telegram_reports_list = telegram_data.get("reports", [])
     report_count = len(telegram_reports_list)
@@ -556,107 +847,25 @@ def generate_html(
 
     today_str = now_ist.strftime('%A, %d %B %Y')
     now_ts = now_ist.strftime('%b %d, %Y, %I:%M %p IST')
-    total_items = len(sorted_articles) + report_count + research_count + paper_count + video_count + twitter_count
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <script data-cfasync="false">try{{var t=localStorage.getItem('financeradar_active_tab')||'news';if(localStorage.getItem('financeradar_filters_collapsed_'+t)!=='false')document.documentElement.classList.add('filters-collapsed')}}catch(e){{}}</script>
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Finance Radar</title>
-    <link rel="icon" href="static/favicon.svg">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Fraunces:ital,opsz,wght@0,9..144,300;0,9..144,500;0,9..144,700;0,9..144,900;1,9..144,400;1,9..144,500&family=Nunito+Sans:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="templates/style.css">
-    <link rel="preload" href="static/tab_news.json" as="fetch" crossorigin>
-    <link rel="preload" href="static/tab_telegram.json" as="fetch" crossorigin>
-    <link rel="preload" href="static/tab_youtube.json" as="fetch" crossorigin>
-    <link rel="preload" href="static/tab_research.json" as="fetch" crossorigin>
-    <script data-cfasync="false">
-    window.__preloaded={{}};
-    ['tab_news','tab_telegram','tab_youtube','tab_research','tab_papers','tab_twitter','tab_twitter_hs','tab_companies','tab_ai_rankings'].forEach(function(k){{
-      window.__preloaded[k]=fetch('static/'+k+'.json').then(function(r){{return r.json()}});
-    }});
-    // Reveal body only after data + fonts ready — app.js calls window.__reveal()
-    window.__reveal = function(){{
-      document.body.style.transition='opacity 0.3s ease';
-      document.body.style.opacity='1';
-    }};
-    // Safety timeout: reveal after 4s no matter what
-    setTimeout(function(){{ window.__reveal(); }}, 4000);
-    </script>
-</head>
-<body>
-    <div class="bk-overlay" id="bk-overlay"></div>
-    <aside id="bk-panel" class="bk-panel">
-        <div class="bk-panel-header">
-            <h3 class="bk-panel-title">Bookmarks</h3>
-            <button class="bk-panel-close" onclick="closeSidebar()">&times;</button>
-        </div>
-        <div class="bk-panel-list" id="bk-list">
-            <p class="bk-empty">No bookmarks yet. Click the bookmark icon on any article to save it.</p>
-        </div>
-        <div class="bk-panel-footer">
-            <button class="bk-action-btn" onclick="copyBookmarks()"><svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><rect x="9" y="9" width="13" height="13" rx="2" ry="2"/><path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"/></svg> <span>Copy All</span></button>
-            <button class="bk-action-btn danger" onclick="clearAllBookmarks()"><svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><polyline points="3 6 5 6 21 6"/><path d="M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6m3 0V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"/></svg> <span>Clear All</span></button>
-        </div>
-    </aside>
+    now_iso = now_ist.isoformat()
+    updated_label = now_ist.strftime('%b %d, %I:%M %p')
+    total_items = news_count + report_count + research_count + paper_count + video_count + twitter_count
 
-    <!-- WSW Sidebar -->
-    <div id="wsw-sidebar-overlay" class="sidebar-overlay">
-      <div class="ai-sidebar">
-        <div class="sidebar-header">
-          <div class="sidebar-title"><span style="font-size:18px;">🗣</span> Who Said What</div>
-          <button class="sidebar-close" onclick="closeWswSidebar()" aria-label="Close">
-            <svg viewBox="0 0 24 24"><line x1="18" y1="6" x2="6" y2="18"></line><line x1="6" y1="6" x2="18" y2="18"></line></svg>
-          </button>
-        </div>
-        <div class="ai-provider-select">
-          <label for="wsw-provider">Model:</label>
-          <select id="wsw-provider" onchange="switchWswProvider()">
-            <option value="">Loading...</option>
-          </select>
-        </div>
-        <div class="wsw-view-switch">
-          <button type="button" class="wsw-view-pill active" data-wsw-view="ideas" onclick="switchWswView('ideas')">Ideas</button>
-          <button type="button" class="wsw-view-pill" data-wsw-view="bookmarks" onclick="switchWswView('bookmarks')">Bookmarks</button>
-        </div>
-        <div id="wsw-content" class="sidebar-content">
-          <div class="sidebar-empty">Loading WSW ideas...</div>
-        </div>
-        <div class="sidebar-footer wsw-footer">
-          <div class="wsw-footer-top">
-            <span id="wsw-updated" class="ai-updated-time">Updated: --</span>
-          </div>
-          <div class="wsw-footer-actions">
-            <button id="wsw-copy-btn" class="sidebar-btn" onclick="copyWswBookmarks()">
-              <svg viewBox="0 0 24 24" width="14" height="14" stroke="currentColor" fill="none" stroke-width="2">
-                <rect x="9" y="9" width="13" height="13" rx="2" ry="2"></rect>
-                <path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"></path>
-              </svg>
-              <span>Copy All</span>
-            </button>
-            <button id="wsw-clear-btn" class="sidebar-btn danger" onclick="clearAllWswBookmarks()">Clear All</button>
-          </div>
-        </div>
-      </div>
-    </div>
-
-    <div class="container">
+    # The page is kept as a list of large fragments and streamed to disk as-is,
+    # so the ~100KB document is never concatenated into one string.
+    parts = [PAGE_HEAD, PAGE_PANELS, f"""    <div class="container">
         <div class="utility">
             <span>{today_str}</span>
             <div class="utility-nav">
                 <a href="/" class="utility-link active">Feed</a>
                 <a href="about.html" class="utility-link">About</a>
                 <div class="search-wrap" id="search-wrap">
-                    <button class="search-toggle" id="search-toggle" type="button" aria-label="Search" data-tooltip="Search">
+                    <button class="icon-btn search-toggle" id="search-toggle" type="button" aria-label="Search" data-tooltip="Search">
                         <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round"><circle cx="11" cy="11" r="8"/><line x1="21" y1="21" x2="16.65" y2="16.65"/></svg>
                     </button>
                     <input type="text" class="search-input" id="search-input" placeholder="Search...">
                 </div>
-                <button class="bk-panel-toggle" id="bk-toggle" type="button" aria-label="Bookmarks" data-tooltip="Bookmarks">
+                <button class="icon-btn bk-panel-toggle" id="bk-toggle" type="button" aria-label="Bookmarks" data-tooltip="Bookmarks">
                     <svg class="bk-icon" viewBox="0 0 24 24" width="18" height="18" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"></path></svg>
                     <span class="bk-count" id="bk-count">0</span>
                 </button>
@@ -670,7 +879,7 @@ def generate_html(
 
         <nav class="tab-bar" role="tablist">
             <button class="tab-pill tab-active" role="tab" aria-selected="true" data-tab="home">All</button>
-            <button class="tab-pill" role="tab" aria-selected="false" data-tab="news"><span class="cat-dot" style="background:#4A8F7A"></span> News <span class="tab-count">{len(sorted_articles)}</span></button>
+            <button class="tab-pill" role="tab" aria-selected="false" data-tab="news"><span class="cat-dot" style="background:#4A8F7A"></span> News <span class="tab-count">{news_count}</span></button>
             <button class="tab-pill" role="tab" aria-selected="false" data-tab="reports"><span class="cat-dot" style="background:#5E6A96"></span> Telegram <span class="tab-count">{report_count}</span></button>
             <button class="tab-pill" role="tab" aria-selected="false" data-tab="research"><span class="cat-dot" style="background:#9A8345"></span> Reports <span class="tab-count">{research_count}</span></button>
             <button class="tab-pill" role="tab" aria-selected="false" data-tab="papers"><span class="cat-dot" style="background:#7A6B8F"></span> Papers <span class="tab-count">{paper_count}</span></button>
@@ -689,11 +898,11 @@ def generate_html(
         <div class="filter-card">
             <div class="filter-head">
                 <div class="stats">
-                    <span><strong>{len(sorted_articles)}</strong> articles</span>
+                    <span><strong>{news_count}</strong> articles</span>
                     <span><strong>{len(all_publishers)}</strong> publishers</span>
                 </div>
                 <div class="filter-head-actions">
-                    <span class="update-time" id="update-time" data-time="{now_ist.isoformat()}">Updated {now_ist.strftime("%b %d, %I:%M %p")} IST</span>
+                    <span class="update-time" id="update-time" data-time="{now_iso}">Updated {updated_label} IST</span>
                     <script>
                     (function(){{
                         var el=document.getElementById('update-time'),t=el&&el.getAttribute('data-time');
@@ -740,7 +949,7 @@ def generate_html(
             <div id="news-list"></div>
         </div>
 
-        <div id="pagination-bottom" class="pagination bottom" aria-label="Pagination"></div>
+        <div id="pagination-bottom" class="pagination bottom" aria-label="Pagination" data-shown="{news_first_page}/{news_total_pages}">{news_pagination_html}</div>
         </div><!-- /tab-news -->
 
         <div id="tab-reports" class="tab-content">
@@ -801,7 +1010,7 @@ def generate_html(
                         <span><strong>{len(research_publishers)}</strong> publishers</span>
                     </div>
                     <div class="filter-head-actions">
-                        <span class="update-time" id="research-update-time" data-time="{now_ist.isoformat()}">Updated {now_ist.strftime("%b %d, %I:%M %p")} IST</span>
+                        <span class="update-time" id="research-update-time" data-time="{now_iso}">Updated {updated_label} IST</span>
                         <script>
                         (function(){{
                             var el=document.getElementById('research-update-time'),t=el&&el.getAttribute('data-time');
@@ -849,7 +1058,7 @@ def generate_html(
                         <span><strong>{paper_source_count}</strong> sources</span>
                     </div>
                     <div class="filter-head-actions">
-                        <span class="update-time" id="papers-update-time" data-time="{now_ist.isoformat()}">Updated {now_ist.strftime("%b %d, %I:%M %p")} IST</span>
+                        <span class="update-time" id="papers-update-time" data-time="{now_iso}">Updated {updated_label} IST</span>
                         <script>
                         (function(){{
                             var el=document.getElementById('papers-update-time'),t=el&&el.getAttribute('data-time');
@@ -879,7 +1088,7 @@ def generate_html(
                         <span class="stat-truncate" id="youtube-publisher-count-label"><strong>{video_channel_count}</strong> channels</span>
                     </div>
                     <div class="filter-head-actions">
-                        <span class="update-time" id="youtube-update-time" data-time="{now_ist.isoformat()}">Updated {now_ist.strftime("%b %d, %I:%M %p")} IST</span>
+                        <span class="update-time" id="youtube-update-time" data-time="{now_iso}">Updated {updated_label} IST</span>
                         <script>
                         (function(){{
                             var el=document.getElementById('youtube-update-time'),t=el&&el.getAttribute('data-time');
@@ -972,7 +1181,7 @@ def generate_html(
                         <span>via <a href="https://tipsheet.markets/" target="_blank" rel="noopener"><strong>Tipsheet</strong></a></span>
                     </div>
                     <div class="filter-head-actions">
-                        <span class="update-time" id="companies-update-time" data-time="{now_ist.isoformat()}">Updated {now_ist.strftime("%b %d, %I:%M %p")} IST</span>
+                        <span class="update-time" id="companies-update-time" data-time="{now_iso}">Updated {updated_label} IST</span>
                         <script>
                         (function(){{
                             var el=document.getElementById('companies-update-time'),t=el&&el.getAttribute('data-time');
@@ -999,115 +1208,72 @@ def generate_html(
             <div id="companies-container"></div>
             <div id="companies-pagination-bottom" class="pagination bottom"></div>
         </div><!-- /tab-companies -->
-"""
+"""]
 
-    html += f"""        <footer>
+    parts.extend([f"""        <footer>
             <div class="foot-stats">
                 <strong>{total_items}</strong> items &middot; last updated {now_ts} &middot; no ads, ever
-                <button type="button" id="refresh-now" class="refresh-now" hidden>Refresh now</button>
-                <span id="refresh-status" class="refresh-status"></span>
-            </div>
-            <nav class="foot-nav">
-                <a href="/">Feed</a>
-                <a href="about.html">About</a>
-                <a href="mailto:kashish.kapoor@zerodha.com">Contact</a>
-            </nav>
-        </footer>
-    </div>
-
-    <button class="scroll-top" id="scroll-top" aria-label="Back to top">
-        <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round"><polyline points="18 15 12 9 6 15"/></svg>
-    </button>
-
-    <div class="keyboard-hint">
-        <kbd>H</kbd> home &middot; <kbd>1</kbd> <kbd>2</kbd> <kbd>3</kbd> <kbd>4</kbd> <kbd>5</kbd> <kbd>6</kbd> <kbd>7</kbd> tabs &middot; <kbd>J</kbd> <kbd>K</kbd> navigate &middot; <kbd>/</kbd> search
-    </div>
-
-    <script data-cfasync="false">
-"""
+""", PAGE_FOOT])
     # Inject publisher data as JSON — use var (not let/const) so variables become
-    # window properties, surviving Cloudflare Rocket Loader's eval()-based re-execution
-    html += f"""        var ALL_PUBLISHERS = {all_publishers_json};
-        var PUBLISHER_PRESETS = {publisher_presets_json};
-        var TELEGRAM_REPORTS = null;
-        var TELEGRAM_GENERATED_AT = "{telegram_generated_at}";
-        var TELEGRAM_WARNINGS = {json.dumps(telegram_warnings)};
-        var AI_RANKINGS_BOOTSTRAP = null;
-        var YOUTUBE_VIDEOS = null;
-        var YOUTUBE_PUBLISHERS = {youtube_publishers_json};
-        var YOUTUBE_BUCKETS = {youtube_buckets_json};
-        var TWITTER_ARTICLES = null;
-        var TWITTER_HIGH_SIGNAL = {twitter_high_signal_json};
-        var TWITTER_LANE_META = {twitter_lane_meta_json};
-        var TWITTER_PUBLISHERS = {twitter_publishers_json};
-        var TWITTER_PRESETS = {twitter_presets_json};
-        var RESEARCH_REPORTS = null;
-        var RESEARCH_PUBLISHERS = {research_publishers_json};
-        var PAPER_ARTICLES = null;
-        var COMPANIES_DATA = null;
-        var COMPANIES_CAPS = {companies_caps_json};
-        var COMPANIES_CATEGORIES = {companies_categories_json};
-        var COMPANIES_SECTORS = {companies_sectors_json};
-        var NEWS_ARTICLES = null;
-        var TODAY_ISO = "{today_iso}";
-        var SITE_GENERATED_AT = "{now_ist.isoformat()}";
-"""
-    html += """
-    </script>
-    <script data-cfasync="false" src="templates/app.js" defer></script>
-</body>
-</html>
-"""
-    all_tab_sources = set()
-
-    def _add_source_label(label):
-        if not isinstance(label, str):
-            return
-        cleaned = label.strip()
-        if cleaned:
-            all_tab_sources.add(cleaned)
-
-    for article in sorted_articles:
-        _add_source_label(article.get("source") or article.get("publisher"))
-
-    for report in telegram_data.get("reports", []):
-        if isinstance(report, dict):
-            _add_source_label(
-                report.get("channel")
-                or report.get("source")
-                or report.get("publisher")
-            )
-
-    for report in report_articles or []:
-        if isinstance(report, dict):
-            _add_source_label(report.get("publisher") or report.get("source"))
-
-    for video in video_articles or []:
-        if isinstance(video, dict):
-            _add_source_label(video.get("publisher") or video.get("source"))
-
-    for tweet in twitter_articles or []:
-        if isinstance(tweet, dict):
-            _add_source_label(tweet.get("publisher") or tweet.get("source"))
-
-    for paper in paper_articles or []:
-        if isinstance(paper, dict):
-            _add_source_label(paper.get("publisher") or paper.get("source"))
-
-    # Apply template replacements
-    html = html.replace("{source_count}", str(len(all_tab_sources)))
-    html = html.replace("{in_focus_count}", str(in_focus_count))
-    html = html.replace("{today_iso}", today_iso)
-
+    # window properties, surviving Cloudflare Rocket Loader's eval()-based re-execution.
+    # Values are serialised here, once each and compactly; lists the client
+    # fetches from static/tab_*.json start out as null. Each blob is its own
+    # fragment, so it is written out as json.dumps produced it.
+    boot_vars = [
+        ("ALL_PUBLISHERS", all_publishers),
+        ("PUBLISHER_PRESETS", publisher_presets),
+        ("TELEGRAM_REPORTS", None),
+        ("TELEGRAM_GENERATED_AT", telegram_generated_at),
+        ("TELEGRAM_WARNINGS", telegram_warnings),
+        ("AI_RANKINGS_BOOTSTRAP", None),
+        ("YOUTUBE_VIDEOS", None),
+        ("YOUTUBE_PUBLISHERS", youtube_publishers),
+        ("YOUTUBE_BUCKETS", list(YOUTUBE_BUCKETS)),
+        ("TWITTER_ARTICLES", None),
+        ("TWITTER_HIGH_SIGNAL", None),
+        ("TWITTER_LANE_META", twitter_lane_meta),
+        ("TWITTER_PUBLISHERS", twitter_publishers),
+        ("TWITTER_PRESETS", twitter_presets),
+        ("RESEARCH_REPORTS", None),
+        ("RESEARCH_PUBLISHERS", research_publishers),
+        ("PAPER_ARTICLES", None),
+        ("COMPANIES_DATA", None),
+        ("COMPANIES_CAPS", companies_caps),
+        ("COMPANIES_CATEGORIES", companies_categories),
+        ("COMPANIES_SECTORS", companies_sectors),
+        ("NEWS_ARTICLES", None),
+        ("TODAY_ISO", today_iso),
+        ("PAGINATION_WINDOW", PAGINATION_WINDOW),
+        ("SITE_GENERATED_AT", now_iso),
+    ]
+    for name, value in boot_vars:
+        parts.extend(("        var ", name, " = ", json.dumps(value, separators=(",", ":")), ";\n"))
+    parts.append(PAGE_CLOSE)
     try:
+        if USE_MINIFIED_CSS:
+            write_minified_css()
         with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-            f.write(html)
+            f.writelines(parts)
         print(f"\nGenerated: {OUTPUT_FILE}")
-        print(f"Total articles: {len(sorted_articles)}")
+        print(f"Total articles: {news_count}")
     except IOError as e:
         print(f"\nERROR: Could not write to {OUTPUT_FILE}: {e}")
 
 
+def _fetch_invidious_fallback(feed):
+    """Retry a YouTube channel feed via Invidious mirrors; returns (instance, articles)."""
+    channel_id = feed.get("feed", "").split("channel_id=")[-1].strip()
+    for instance in INVIDIOUS_INSTANCES:
+        fallback_url = f"https://{instance}/feed/channel/{channel_id}"
+        try:
+            articles = fetch_feed({**feed, "feed": fallback_url})
+            if articles:
+                return instance, articles
+        except Exception:
+            continue
+    return None, []
+
+
 def main():
     logger = FeedLogger()
 
@@ -1211,25 +1377,26 @@ def main():
     video_feed_ids_fetched = set(
         a.get("feed_id") for a in all_articles if a.get("category") == "Videos"
     )
+    invidious_feeds = []
     for feed in feeds:
         if feed.get("category") != "Videos":
             continue
         if feed["id"] in video_feed_ids_fetched:
             continue  # already fetched successfully
-        feed_url = feed.get("feed", "")
-        if "channel_id=" not in feed_url:
+        if "channel_id=" not in feed.get("feed", ""):
             continue  # playlist_id feeds — Invidious format differs, skip
-        channel_id = feed_url.split("channel_id=")[-1].strip()
-        for instance in INVIDIOUS_INSTANCES:
-            fallback_url = f"https://{instance}/feed/channel/{channel_id}"
-            try:
-                articles = fetch_feed({**feed, "feed": fallback_url})
+        invidious_feeds.append(feed)
+
+    # Channels are independent, so retry them concurrently; instances are
+    # still tried in order per channel.
+    if invidious_feeds:
+        with ThreadPoolExecutor(max_workers=FEED_THREAD_WORKERS) as executor:
+            for feed, (instance, articles) in zip(
+                invidious_feeds, executor.map(_fetch_invidious_fallback, invidious_feeds)
+            ):
                 if articles:
                     all_articles.extend(articles)
                     logger.ok(f"Invidious:{instance} {feed['name']}", f"{len(articles)} videos")
-                    break
-            except Exception:
-                continue
 
     # Separate video, twitter, and report articles from regular articles
     video_articles = [a for a in all_articles if a.get("category") == "Videos"]
@@ -1245,7 +1412,10 @@ def main():
     if filtered_video_count:
         logger.info(f"Videos: filtered {filtered_video_count} noisy titles")
 
-    # Sort videos, twitter, and reports by date (newest first), no filtering/grouping needed
+    # Sort videos, twitter, and reports by date (newest first), no filtering/grouping needed.
+    # These key on get_sort_timestamp rather than a cached _ts: key= already runs
+    # once per item, and a _ts stamped here would leak into youtube_cache.json
+    # through serialize_video.
     video_articles.sort(key=get_sort_timestamp, reverse=True)
     twitter_articles.sort(key=get_sort_timestamp, reverse=True)
 
@@ -8,21 +8,47 @@ text cleaning, and export. No feed fetching or HTML generation.
 import re
 import json
 import os
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from html import unescape
 from difflib import SequenceMatcher
 
+# rapidfuzz: optional C++ Indel ratio, used to rule pairs out before difflib
+try:
+    from rapidfuzz.distance import Indel
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# orjson: optional Rust JSON encoder for the articles.json export
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Get script directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # IST timezone for consistent display
 IST_TZ = timezone(timedelta(hours=5, minutes=30))
 
+# Common prefixes like "BREAKING:", "EXCLUSIVE:", "UPDATE:", stacked or not
+TITLE_PREFIX_RE = re.compile(
+    r'^(?:(?:breaking|exclusive|update|urgent|just in|live|watch|video'
+    r'|opinion|analysis|explained):\s*)+',
+    re.IGNORECASE,
+)
+NON_WORD_RE = re.compile(r'[^\w\s]')
+WHITESPACE_RE = re.compile(r'\s+')
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
 
 # =============================================================================
 # DUPLICATE HEADLINE GROUPING - Functions for similarity detection
 # =============================================================================
 
+@lru_cache(maxsize=4096)
 def normalize_title(title):
     """Normalize title for comparison (lowercase, remove prefixes, clean)."""
     if not title:
@@ -32,26 +58,22 @@ def normalize_title(title):
     normalized = title.lower()
 
     # Remove common prefixes like "BREAKING:", "EXCLUSIVE:", "UPDATE:", etc.
-    prefixes = [
-        r'^breaking:\s*', r'^exclusive:\s*', r'^update:\s*', r'^urgent:\s*',
-        r'^just in:\s*', r'^live:\s*', r'^watch:\s*', r'^video:\s*',
-        r'^opinion:\s*', r'^analysis:\s*', r'^explained:\s*',
-    ]
-    for prefix in prefixes:
-        normalized = re.sub(prefix, '', normalized, flags=re.IGNORECASE)
+    normalized = TITLE_PREFIX_RE.sub('', normalized)
 
     # Remove punctuation and extra whitespace
-    normalized = re.sub(r'[^\w\s]', ' ', normalized)
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
+    normalized = NON_WORD_RE.sub(' ', normalized)
+    normalized = WHITESPACE_RE.sub(' ', normalized).strip()
 
     return normalized
 
 
 def titles_are_similar(title1, title2, threshold=0.75):
-    """Check similarity using difflib.SequenceMatcher."""
-    norm1 = normalize_title(title1)
-    norm2 = normalize_title(title2)
+    """Check similarity using difflib's ratio (rapidfuzz prefilter when installed)."""
+    return _similar_norm(normalize_title(title1), normalize_title(title2), threshold)
 
+
+def _similar_norm(norm1, norm2, threshold=0.75):
+    """titles_are_similar() for titles already passed through normalize_title()."""
     if not norm1 or not norm2:
         return False
 
@@ -59,18 +81,37 @@ def titles_are_similar(title1, title2, threshold=0.75):
     if norm1 == norm2:
         return True
 
-    # Use SequenceMatcher for fuzzy matching
+    # Both ratios are 2*matches/(len1+len2) with matches <= the shorter
+    # length, so titles whose lengths differ too much can never reach the
+    # threshold — skip the matcher for those.
+    len1, len2 = len(norm1), len(norm2)
+    if 2 * min(len1, len2) / (len1 + len2) < threshold:
+        return False
+
+    # difflib's matching blocks form a common subsequence, so its ratio is
+    # never above the LCS-based Indel ratio. That makes rapidfuzz a cheap
+    # upper bound that rules most pairs out; difflib still makes the call,
+    # so grouping is the same with or without rapidfuzz installed.
+    if RAPIDFUZZ_AVAILABLE and Indel.normalized_similarity(norm1, norm2, score_cutoff=threshold) < threshold:
+        return False
     ratio = SequenceMatcher(None, norm1, norm2).ratio()
     return ratio >= threshold
 
 
+@lru_cache(maxsize=4096)
 def get_title_signature(title):
     """Get a set of significant words from title for quick comparison."""
     normalized = normalize_title(title)
-    words = set(normalized.split())
-    # Filter out very short words and common words
-    significant = {w for w in words if len(w) >= 4}
-    return significant
+    # Filter out very short words and common words (frozen: result is cached)
+    return frozenset(w for w in normalized.split() if len(w) >= 4)
+
+
+if hasattr(int, "bit_count"):
+    def _popcount(bits):
+        return bits.bit_count()
+else:  # Python < 3.10
+    def _popcount(bits):
+        return bin(bits).count("1")
 
 
 def group_similar_articles(articles):
@@ -88,62 +129,133 @@ def group_similar_articles(articles):
     from collections import defaultdict
 
     articles_by_date = defaultdict(list)
-    for i, article in enumerate(articles):
-        date_key = ""
+    for article in articles:
+        date_key = None
         if article.get("date"):
             try:
-                date_key = article["date"].strftime("%Y-%m-%d")
-            except (AttributeError, ValueError, TypeError):
+                # date objects hash/compare directly — no strftime formatting
+                date_key = article["date"].date()
+            except (AttributeError, TypeError):
                 pass
-        articles_by_date[date_key].append((i, article))
+        articles_by_date[date_key].append(article)
+        # Sort timestamp rides along on the article for generate_html
+        article["_ts"] = _timestamp_of(article.get("date"))
 
     groups = []
-    used = set()
 
-    # Pre-compute title signatures for all articles
-    signatures = {}
-    for i, article in enumerate(articles):
-        signatures[i] = get_title_signature(article["title"])
+    def add_to_group(group, other):
+        # Don't add duplicates from the same source
+        if other["source"] != group["primary"]["source"]:
+            group["related_sources"].append({
+                "name": other["source"],
+                "url": other["source_url"],
+                "link": other["link"],
+            })
+        group["all_articles"].append(other)
 
     for date_key, date_articles in articles_by_date.items():
-        for idx, (i, article) in enumerate(date_articles):
-            if i in used:
+        if len(date_articles) == 1:
+            # Nothing to compare against: skip the title work entirely
+            article = date_articles[0]
+            groups.append({"primary": article, "related_sources": [], "all_articles": [article]})
+            continue
+
+        # Coalesce byte-identical titles (syndicated wire copy) in one pass so
+        # the pairwise comparison below only sees one representative per title.
+        # Normalized titles and signatures are computed here, per bucket; the
+        # hot loop reads them from parallel lists indexed by representative
+        # position.
+        rep_articles = []
+        rep_norms = []
+        rep_sigs = []
+        rep_dups = []
+        first_with_title = {}
+        for article in date_articles:
+            norm = normalize_title(article["title"])
+            sig = get_title_signature(article["title"])
+            raw_key = (article["title"] or "").strip().lower()
+            rep = first_with_title.get(raw_key) if norm else None
+            if rep is None:
+                if norm:
+                    first_with_title[raw_key] = len(rep_articles)
+                rep_articles.append(article)
+                rep_norms.append(norm)
+                rep_sigs.append(sig)
+                rep_dups.append([])
+            else:
+                rep_dups[rep].append(article)
+        rep_count = len(rep_articles)
+
+        # Inverted index: significant word -> positions in representatives.
+        # Passing the overlap filter requires at least one shared word, so
+        # only posting-list neighbours need comparing. Articles with an empty
+        # signature bypass that filter and stay candidates for everyone.
+        # Each signature is also packed into an int bitmap over the bucket's
+        # vocabulary, so the overlap filter is one AND plus a popcount.
+        postings = defaultdict(list)
+        unsigned = []
+        vocab = {}
+        sig_bits = []
+        sig_sizes = []
+        for pos, sig in enumerate(rep_sigs):
+            bits = 0
+            if sig:
+                for word in sig:
+                    postings[word].append(pos)
+                    bits |= 1 << vocab.setdefault(word, len(vocab))
+            else:
+                unsigned.append(pos)
+            sig_bits.append(bits)
+            sig_sizes.append(len(sig))
+
+        # Per-bucket "already grouped" flags indexed by representative
+        # position; buckets never share articles, so no global set is needed.
+        used = bytearray(rep_count)
+
+        for idx in range(rep_count):
+            if used[idx]:
                 continue
 
             # Start a new group with this article
+            article = rep_articles[idx]
             group = {
                 "primary": article,
                 "related_sources": [],
                 "all_articles": [article],
             }
-            used.add(i)
-
-            sig_i = signatures[i]
+            used[idx] = 1
+            for dup in rep_dups[idx]:
+                add_to_group(group, dup)
+
+            sig_i = rep_sigs[idx]
+            norm_i = rep_norms[idx]
+            bits_i = sig_bits[idx]
+            size_i = sig_sizes[idx]
+            if sig_i:
+                candidates = set(unsigned)
+                for word in sig_i:
+                    candidates.update(postings[word])
+                candidates = sorted(pos for pos in candidates if pos > idx)
+            else:
+                candidates = range(idx + 1, rep_count)
 
             # Only compare with other articles from the same date
-            for j, other in date_articles[idx + 1:]:
-                if j in used:
+            for pos in candidates:
+                if used[pos]:
+                    continue
+
+                # Quick filter: shared words must cover >= half of the
+                # smaller signature
+                size_j = sig_sizes[pos]
+                if size_i and size_j and 2 * _popcount(bits_i & sig_bits[pos]) < min(size_i, size_j):
+                    # Not enough word overlap, skip expensive comparison
                     continue
 
-                # Quick filter: check word overlap first
-                sig_j = signatures[j]
-                if sig_i and sig_j:
-                    overlap = len(sig_i & sig_j)
-                    min_len = min(len(sig_i), len(sig_j))
-                    if min_len > 0 and overlap / min_len < 0.5:
-                        # Not enough word overlap, skip expensive comparison
-                        continue
-
-                if titles_are_similar(article["title"], other["title"]):
-                    # Don't add duplicates from the same source
-                    if other["source"] != article["source"]:
-                        group["related_sources"].append({
-                            "name": other["source"],
-                            "url": other["source_url"],
-                            "link": other["link"],
-                        })
-                    group["all_articles"].append(other)
-                    used.add(j)
+                if _similar_norm(norm_i, rep_norms[pos]):
+                    add_to_group(group, rep_articles[pos])
+                    for dup in rep_dups[pos]:
+                        add_to_group(group, dup)
+                    used[pos] = 1
 
             # Prefer official source as group primary
             official = next(
@@ -167,26 +279,37 @@ def clean_html(text):
     """Remove HTML tags and clean up text."""
     if not text:
         return ""
-    # Remove HTML tags
-    clean = re.sub(r'<[^>]+>', '', text)
+    # Remove HTML tags (most feed text is plain, so skip the regex scan then)
+    clean = HTML_TAG_RE.sub('', text) if '<' in text else text
     # Decode HTML entities (handles &nbsp;, &amp;, &lt;, etc.)
     clean = unescape(clean)
     # Remove extra whitespace
-    clean = re.sub(r'\s+', ' ', clean).strip()
+    clean = WHITESPACE_RE.sub(' ', clean).strip()
     return clean[:250] + "..." if len(clean) > 250 else clean
 
 
-def get_sort_timestamp(article):
-    """Get a comparable timestamp for sorting, handling timezone differences."""
-    dt = article["date"]
+def _timestamp_of(dt):
+    # Always a float: when every sort key is a float, list.sort() compares
+    # them with its specialised float path instead of generic rich compare.
     if dt is None:
-        return 0  # Put at the end
+        return 0.0  # Put at the end
 
     try:
         # timestamp() handles both aware and naive datetimes
         return dt.timestamp()
     except (OSError, OverflowError, ValueError):
-        return 0
+        return 0.0
+
+
+def get_sort_timestamp(article):
+    """Get a comparable timestamp for sorting, handling timezone differences.
+
+    Uses article["_ts"] when group_similar_articles() has already cached it.
+    """
+    ts = article.get("_ts")
+    if ts is None:
+        ts = _timestamp_of(article["date"])
+    return ts
 
 
 def to_local_datetime(dt):
@@ -197,8 +320,8 @@ def to_local_datetime(dt):
     try:
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
-        # Convert to IST via timestamp
-        return datetime.fromtimestamp(dt.timestamp(), IST_TZ)
+        # Fixed-offset shift; no round trip through a float timestamp
+        return dt.astimezone(IST_TZ)
     except (OSError, OverflowError, ValueError):
         return dt
 
@@ -216,9 +339,14 @@ def export_articles_json(article_groups):
             "category": article.get("category", "News"),
             "has_related": len(group["related_sources"]) > 0
         })
+    payload = {"generated_at": datetime.now(IST_TZ).isoformat(), "articles": articles}
     output_path = os.path.join(SCRIPT_DIR, "static", "articles.json")
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump({"generated_at": datetime.now(IST_TZ).isoformat(), "articles": articles}, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
     print(f"Exported {len(articles)} articles to {output_path}")
 
 
@@ -23,7 +23,9 @@ DEFAULT_USER_AGENT = (
 
 # ── Feed fetching ─────────────────────────────────────────────────────
 FEED_FETCH_TIMEOUT = 15          # seconds, per-feed HTTP timeout
-FEED_CURL_TIMEOUT = 20           # seconds, curl fallback timeout
+FEED_CURL_TIMEOUT = 20           # seconds, curl fallback timeout (report scrapers)
+FEED_UA_RETRY_TIMEOUT = 20       # seconds, per-attempt timeout for the 403 User-Agent retries
+FEED_FALLBACK_USER_AGENTS = ("FeedFetcher/1.0", "Mozilla/5.0 (compatible; RSS Reader)")
 FEED_THREAD_WORKERS = 10         # concurrent feed fetches
 MAX_ARTICLES_PER_FEED = 50       # cap per feed in final output
 RSS_PROXY_ENV_VAR = "RSS_PROXY_URL"   # optional Cloudflare RSS proxy base URL
@@ -31,6 +33,10 @@ RSS_PROXY_TIMEOUT = 20                # seconds for proxy fallback request
 RSS_PROXY_ALLOWED_CATEGORIES = ("News", "Reports", "Twitter")
 RSS_PROXY_RETRY_HTTP_CODES = (403, 429)
 
+# ── News tab rendering ────────────────────────────────────────────────
+NEWS_PAGE_SIZE = 20              # must match PAGE_SIZE in templates/app.js
+PAGINATION_WINDOW = 7            # numbered page buttons shown around the active page
+
 # ── Article freshness ─────────────────────────────────────────────────
 NEWS_FRESHNESS_DAYS = 5          # News tab: discard articles older than this
 TWITTER_FRESHNESS_DAYS = 5       # Twitter tab: discard tweets older than this
@@ -12,18 +12,28 @@ import urllib.error
 import urllib.parse
 import xml.etree.ElementTree as ET
 import base64
+from email.utils import parsedate_to_datetime
 from datetime import datetime, timedelta, timezone
 import re
 import os
-import subprocess
 import html
+import http.client
+import io
 import socket
+import threading
+
+try:
+    from lxml import etree as LXML_ET
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
 from articles import IST_TZ
 from config import (
     DEFAULT_USER_AGENT,
-    FEED_CURL_TIMEOUT,
+    FEED_FALLBACK_USER_AGENTS,
     FEED_FETCH_TIMEOUT,
+    FEED_UA_RETRY_TIMEOUT,
     RSS_PROXY_ALLOWED_CATEGORIES,
     RSS_PROXY_ENV_VAR,
     RSS_PROXY_RETRY_HTTP_CODES,
@@ -40,6 +50,8 @@ INVIDIOUS_INSTANCES = ["inv.nadeko.net", "yewtu.be", "iv.datura.network"]
 DC_NS = "http://purl.org/dc/elements/1.1/"
 GOOGLE_RSS_PREFIX = "https://news.google.com/rss/"
 GOOGLE_ARTICLE_PATH_RE = re.compile(r"/rss/articles/([^/?#]+)")
+WHITESPACE_RE = re.compile(r"\s+")
+HTML_TAG_RE = re.compile(r"<[^>]+>")
 HTTP_URL_RE = re.compile(r"https?://[^\s\"'<>\\)]+", re.IGNORECASE)
 X_PROFILE_HANDLE_RE = re.compile(r"^https?://(?:www\.)?x\.com/([^/?#]+)", re.IGNORECASE)
 TWEET_STATUS_RE = re.compile(
@@ -53,6 +65,11 @@ YOUTUBE_BUCKETS = (
 )
 DEFAULT_YOUTUBE_BUCKET = "Educational/Explainers"
 
+if LXML_AVAILABLE:
+    XML_PARSE_ERRORS = (ET.ParseError, LXML_ET.XMLSyntaxError)
+else:
+    XML_PARSE_ERRORS = (ET.ParseError,)
+
 
 def _normalize_video_feed_buckets(feeds):
     """Ensure each YouTube feed has a supported bucket for UI filtering."""
@@ -118,10 +135,28 @@ def parse_date(date_str, source_name=None):
 
     # Clean up common timezone issues
     date_str = date_str.strip()
-    date_str = re.sub(r'\s+', ' ', date_str)
+    date_str = WHITESPACE_RE.sub(' ', date_str)
     date_str = date_str.replace("GMT", "+0000").replace("UTC", "+0000")
     date_str = date_str.replace("IST", "+0530").replace("EDT", "-0400").replace("EST", "-0500")
 
+    # Fast paths for the two shapes nearly every feed uses. Only timezone-aware
+    # results are accepted here; anything else (naive RBI dates, odd offsets)
+    # falls through to the strptime loop so its handling is unchanged.
+    dt = None
+    if len(date_str) > 3 and date_str[3] == ",":
+        try:
+            dt = parsedate_to_datetime(date_str)  # RFC 2822
+        except (TypeError, ValueError, IndexError, OverflowError):
+            dt = None
+    elif date_str[:4].isdigit() and date_str[10:11] == "T":
+        iso_str = date_str[:-1] + "+00:00" if date_str[-1] in "Zz" else date_str
+        try:
+            dt = datetime.fromisoformat(iso_str)
+        except ValueError:
+            dt = None
+    if dt is not None and dt.tzinfo is not None:
+        return dt
+
     for fmt in formats:
         try:
             dt = datetime.strptime(date_str, fmt)
@@ -159,33 +194,118 @@ THE_KEN_ALL_STORIES_URL = "https://the-ken.com/all-stories/"
 THE_KEN_GOOGLE_NEWS_RSS = "https://news.google.com/rss/search?q=site:the-ken.com&hl=en-IN&gl=IN&ceid=IN:en"
 
 
+# Keep-alive connections, one per (thread, scheme, host, TLS context). Many
+# feeds share a host (Google News, YouTube, ET), so reusing the socket saves a
+# TCP + TLS handshake per request. Thread-local because http.client
+# connections are not safe to share between the fetch pool's workers.
+_KEEPALIVE = threading.local()
+_MAX_REDIRECTS = 10
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+
+def _keepalive_connection(scheme, netloc, timeout, context):
+    pool = getattr(_KEEPALIVE, "conns", None)
+    if pool is None:
+        pool = _KEEPALIVE.conns = {}
+    key = (scheme, netloc, id(context))
+    conn = pool.get(key)
+    if conn is None:
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(netloc, timeout=timeout, context=context)
+        else:
+            conn = http.client.HTTPConnection(netloc, timeout=timeout)
+        pool[key] = conn
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            try:
+                conn.sock.settimeout(timeout)
+            except OSError:
+                conn.close()  # socket already dead; request() will redial
+    return key, conn
+
+
+def _drop_keepalive(key):
+    conn = getattr(_KEEPALIVE, "conns", {}).pop(key, None)
+    if conn is not None:
+        conn.close()
+
+
+def _keepalive_get(url, headers, timeout, context):
+    """GET url over a pooled connection, following redirects like urlopen.
+
+    Raises the same exception types urlopen would: HTTPError for 4xx/5xx and
+    URLError for connection-level failures, so callers' fallbacks still apply.
+    """
+    for _ in range(_MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        selector = parts.path or "/"
+        if parts.query:
+            selector += "?" + parts.query
+        for attempt in (0, 1):
+            key, conn = _keepalive_connection(parts.scheme, parts.netloc, timeout, context)
+            reused = conn.sock is not None
+            try:
+                conn.request("GET", selector, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except socket.timeout:
+                _drop_keepalive(key)
+                raise
+            except (http.client.HTTPException, OSError) as e:
+                _drop_keepalive(key)
+                if reused and attempt == 0:
+                    continue  # server dropped an idle keep-alive socket; redial once
+                raise urllib.error.URLError(e)
+        if response.will_close:
+            _drop_keepalive(key)
+
+        location = response.getheader("Location")
+        if response.status in _REDIRECT_CODES and location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.msg, None)
+        return body
+    raise urllib.error.URLError(f"too many redirects for {url}")
+
+
+def _open_url_bytes(url, headers, timeout, context):
+    """Read url via the keep-alive pool, or urlopen when a proxy env is set."""
+    scheme = urllib.parse.urlsplit(url).scheme.lower()
+    if scheme in ("http", "https") and not urllib.request.getproxies():
+        return _keepalive_get(url, headers, timeout, context)
+    req = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(req, timeout=timeout, context=context) as response:
+        return response.read()
+
+
 def _fetch_url_bytes(url, timeout=15):
-    """Fetch raw bytes from URL with SSL and 403 curl fallback."""
+    """Fetch raw bytes from URL with SSL and 403 User-Agent fallback."""
     req_headers = {
         "User-Agent": DEFAULT_USER_AGENT,
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.9",
     }
-    req = urllib.request.Request(url, headers=req_headers)
     try:
         try:
-            with urllib.request.urlopen(req, timeout=timeout, context=SSL_CONTEXT) as response:
-                return response.read()
+            return _open_url_bytes(url, req_headers, timeout, SSL_CONTEXT)
         except ssl.SSLCertVerificationError:
             print(f"  [WARN] TLS verification failed for {url}, falling back to unverified")
-            with urllib.request.urlopen(req, timeout=timeout, context=SSL_CONTEXT_NOVERIFY) as response:
-                return response.read()
+            return _open_url_bytes(url, req_headers, timeout, SSL_CONTEXT_NOVERIFY)
     except urllib.error.HTTPError as e:
         if e.code != 403:
             raise
-        for ua in ["FeedFetcher/1.0", "Mozilla/5.0 (compatible; RSS Reader)"]:
-            result = subprocess.run(
-                ["curl", "-sL", "-A", ua, url],
-                capture_output=True,
-                timeout=FEED_CURL_TIMEOUT,
-            )
-            if result.returncode == 0 and result.stdout:
-                return result.stdout
+        # Some WAFs only block browser-looking clients; retry in-process with
+        # plain feed-reader headers instead of shelling out to curl.
+        for ua in FEED_FALLBACK_USER_AGENTS:
+            try:
+                content = _open_url_bytes(url, {"User-Agent": ua, "Accept": "*/*"}, FEED_UA_RETRY_TIMEOUT, SSL_CONTEXT)
+            except (urllib.error.URLError, OSError):
+                continue
+            if content:
+                return content
         raise
 
 
@@ -209,7 +329,7 @@ def _build_proxy_feed_url(proxy_base, feed_url):
 
 
 def _is_retryable_for_proxy(exc):
-    if isinstance(exc, ET.ParseError):
+    if isinstance(exc, XML_PARSE_ERRORS):
         return True
     if isinstance(exc, socket.timeout):
         return True
@@ -256,15 +376,49 @@ def _fetch_feed_via_proxy(feed_config):
     return articles, google_stats
 
 
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ATOM_ENTRY_TAG = f"{{{ATOM_NS}}}entry"
+
+
+def _iter_feed_items(content):
+    """Yield each RSS <item> / Atom <entry> element as soon as it is parsed.
+
+    Streams with iterparse (lxml when installed, else ElementTree) so only one
+    item subtree is alive at a time; callers must finish with an element before
+    advancing, since it is cleared once the generator resumes.
+    """
+    if LXML_AVAILABLE:
+        # Decoded text is re-encoded as UTF-8, so the encoding= in the feed's
+        # <?xml?> declaration no longer describes these bytes; override it.
+        encoding = None
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+            encoding = "utf-8"
+        # Entity expansion and network lookups off: feeds are untrusted input.
+        events = LXML_ET.iterparse(
+            io.BytesIO(content),
+            events=("end",),
+            tag=("item", ATOM_ENTRY_TAG),
+            encoding=encoding,
+            resolve_entities=False,
+            no_network=True,
+        )
+    else:
+        source = io.StringIO(content) if isinstance(content, str) else io.BytesIO(content)
+        events = ET.iterparse(source, events=("end",))
+    for _, elem in events:
+        if elem.tag == "item" or elem.tag == ATOM_ENTRY_TAG:
+            yield elem
+            elem.clear()
+
+
 def _parse_feed_content(content, feed_config):
     """Parse raw RSS/Atom XML content into article objects."""
     feed_name = feed_config["name"]
     source_url = feed_config["url"]
-    articles = []
-
-    # Parse XML
-    root = ET.fromstring(content)
     feed_id = feed_config.get("id", "")
+    ns = {"atom": ATOM_NS}
+    media_ns = "{http://search.yahoo.com/mrss/}"
 
     def _ing_link_allowed(link):
         if feed_id != "ing-think-rss":
@@ -272,120 +426,125 @@ def _parse_feed_content(content, feed_config):
         link_l = (link or "").lower()
         return "/articles/" in link_l or "/snaps/" in link_l
 
-    # Handle RSS 2.0 format
-    items = root.findall(".//item")
-
-    # Handle Atom format
-    if not items:
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        items = root.findall(".//atom:entry", ns)
-
-        for item in items:
-            title = item.find("atom:title", ns)
-            link = item.find("atom:link", ns)
-
-            pub_date = item.find("atom:published", ns)
-            if pub_date is None:
-                pub_date = item.find("atom:updated", ns)
-
-            summary = item.find("atom:summary", ns)
-            if summary is None:
-                summary = item.find("atom:content", ns)
-            guid = item.find("atom:id", ns)
-
-            link_href = link.get("href") if link is not None else ""
-            if not _ing_link_allowed(link_href):
-                continue
-
-            article_data = {
-                "title": title.text if title is not None and title.text else "No title",
-                "link": link_href,
-                "date": parse_date(pub_date.text if pub_date is not None else "", feed_name),
-                "description": summary.text[:300] if summary is not None and summary.text else "",
-                "source": feed_name,
-                "source_url": source_url,
-                "category": feed_config.get("category", "News"),
-                "region": feed_config.get("region", "Indian"),
-                "publisher": feed_config.get("publisher", ""),
-                "youtube_bucket": feed_config.get("youtube_bucket", ""),
-                "source_tier": feed_config.get("source_tier", ""),
-                "feed_id": feed_config["id"],
-                "guid": guid.text.strip() if guid is not None and guid.text else "",
-            }
-
-            # YouTube-specific: extract video ID and thumbnail
-            yt_vid = item.find("{http://www.youtube.com/xml/schemas/2015}videoId")
-            if yt_vid is not None and yt_vid.text:
-                article_data["video_id"] = yt_vid.text
-                media_group = item.find("{http://search.yahoo.com/mrss/}group")
-                thumb = ""
-                if media_group is not None:
-                    thumb_el = media_group.find("{http://search.yahoo.com/mrss/}thumbnail")
-                    if thumb_el is not None:
-                        thumb = thumb_el.get("url", "")
-                article_data["thumbnail"] = thumb or f"https://i.ytimg.com/vi/{yt_vid.text}/mqdefault.jpg"
-
-            articles.append(article_data)
-    else:
-        # RSS 2.0 format
-        media_ns = "{http://search.yahoo.com/mrss/}"
-        for item in items:
-            title = item.find("title")
-            link = item.find("link")
-            pub_date = item.find("pubDate")
-            if pub_date is None:
-                pub_date = item.find(f"{{{DC_NS}}}date")
-            if pub_date is None:
-                pub_date = item.find("updated")
-            if pub_date is None:
-                pub_date = item.find("published")
-            guid = item.find("guid")
-            description = item.find("description")
-            link_text = link.text if link is not None and link.text else ""
-            if not _ing_link_allowed(link_text):
-                continue
-
-            # Extract image from media:thumbnail, media:content, or enclosure
-            image_url = ""
-            thumb = item.find(f"{media_ns}thumbnail")
-            if thumb is not None:
-                image_url = thumb.get("url", "")
-            if not image_url:
-                media_content = item.find(f"{media_ns}content")
-                if media_content is not None and media_content.get("medium", "") == "image":
-                    image_url = media_content.get("url", "")
-            if not image_url:
-                enclosure = item.find("enclosure")
-                if enclosure is not None and enclosure.get("type", "").startswith("image/"):
-                    image_url = enclosure.get("url", "")
-
-            articles.append({
-                "title": title.text if title is not None and title.text else "No title",
-                "link": link_text,
-                "date": parse_date(pub_date.text if pub_date is not None else "", feed_name),
-                "description": description.text[:300] if description is not None and description.text else "",
-                "source": feed_name,
-                "source_url": source_url,
-                "category": feed_config.get("category", "News"),
-                "region": feed_config.get("region", "Indian"),
-                "publisher": feed_config.get("publisher", ""),
-                "youtube_bucket": feed_config.get("youtube_bucket", ""),
-                "source_tier": feed_config.get("source_tier", ""),
-                "image": image_url,
-                "feed_id": feed_config["id"],
-                "guid": guid.text.strip() if guid is not None and guid.text else "",
-            })
-
-    return articles
+    def _atom_article(item):
+        title = item.find("atom:title", ns)
+        link = item.find("atom:link", ns)
+
+        pub_date = item.find("atom:published", ns)
+        if pub_date is None:
+            pub_date = item.find("atom:updated", ns)
+
+        summary = item.find("atom:summary", ns)
+        if summary is None:
+            summary = item.find("atom:content", ns)
+        guid = item.find("atom:id", ns)
+
+        link_href = link.get("href") if link is not None else ""
+        if not _ing_link_allowed(link_href):
+            return None
+
+        article_data = {
+            "title": title.text if title is not None and title.text else "No title",
+            "link": link_href,
+            "date": parse_date(pub_date.text if pub_date is not None else "", feed_name),
+            "description": summary.text[:300] if summary is not None and summary.text else "",
+            "source": feed_name,
+            "source_url": source_url,
+            "category": feed_config.get("category", "News"),
+            "region": feed_config.get("region", "Indian"),
+            "publisher": feed_config.get("publisher", ""),
+            "youtube_bucket": feed_config.get("youtube_bucket", ""),
+            "source_tier": feed_config.get("source_tier", ""),
+            "feed_id": feed_config["id"],
+            "guid": guid.text.strip() if guid is not None and guid.text else "",
+        }
+
+        # YouTube-specific: extract video ID and thumbnail
+        yt_vid = item.find("{http://www.youtube.com/xml/schemas/2015}videoId")
+        if yt_vid is not None and yt_vid.text:
+            article_data["video_id"] = yt_vid.text
+            media_group = item.find(f"{media_ns}group")
+            thumb = ""
+            if media_group is not None:
+                thumb_el = media_group.find(f"{media_ns}thumbnail")
+                if thumb_el is not None:
+                    thumb = thumb_el.get("url", "")
+            article_data["thumbnail"] = thumb or f"https://i.ytimg.com/vi/{yt_vid.text}/mqdefault.jpg"
+
+        return article_data
+
+    def _rss_article(item):
+        title = item.find("title")
+        link = item.find("link")
+        pub_date = item.find("pubDate")
+        if pub_date is None:
+            pub_date = item.find(f"{{{DC_NS}}}date")
+        if pub_date is None:
+            pub_date = item.find("updated")
+        if pub_date is None:
+            pub_date = item.find("published")
+        guid = item.find("guid")
+        description = item.find("description")
+        link_text = link.text if link is not None and link.text else ""
+        if not _ing_link_allowed(link_text):
+            return None
+
+        # Extract image from media:thumbnail, media:content, or enclosure
+        image_url = ""
+        thumb = item.find(f"{media_ns}thumbnail")
+        if thumb is not None:
+            image_url = thumb.get("url", "")
+        if not image_url:
+            media_content = item.find(f"{media_ns}content")
+            if media_content is not None and media_content.get("medium", "") == "image":
+                image_url = media_content.get("url", "")
+        if not image_url:
+            enclosure = item.find("enclosure")
+            if enclosure is not None and enclosure.get("type", "").startswith("image/"):
+                image_url = enclosure.get("url", "")
+
+        return {
+            "title": title.text if title is not None and title.text else "No title",
+            "link": link_text,
+            "date": parse_date(pub_date.text if pub_date is not None else "", feed_name),
+            "description": description.text[:300] if description is not None and description.text else "",
+            "source": feed_name,
+            "source_url": source_url,
+            "category": feed_config.get("category", "News"),
+            "region": feed_config.get("region", "Indian"),
+            "publisher": feed_config.get("publisher", ""),
+            "youtube_bucket": feed_config.get("youtube_bucket", ""),
+            "source_tier": feed_config.get("source_tier", ""),
+            "image": image_url,
+            "feed_id": feed_config["id"],
+            "guid": guid.text.strip() if guid is not None and guid.text else "",
+        }
+
+    # RSS 2.0 items win; Atom entries are only used when a feed has no items.
+    rss_articles = []
+    atom_articles = []
+    seen_rss_item = False
+    for item in _iter_feed_items(content):
+        if item.tag == "item":
+            seen_rss_item = True
+            article = _rss_article(item)
+            if article:
+                rss_articles.append(article)
+        elif not seen_rss_item:
+            article = _atom_article(item)
+            if article:
+                atom_articles.append(article)
+
+    return rss_articles if seen_rss_item else atom_articles
 
 
 def _clean_html_text(raw):
     """Strip tags/entities and collapse whitespace."""
     if not raw:
         return ""
-    text = re.sub(r"<[^>]+>", " ", raw)
+    text = HTML_TAG_RE.sub(" ", raw) if "<" in raw else raw
     text = html.unescape(text)
-    return re.sub(r"\s+", " ", text).strip()
+    return WHITESPACE_RE.sub(" ", text).strip()
 
 
 def _is_google_rss_feed(feed_url):
@@ -517,7 +676,7 @@ def _parse_the_ken_date(date_str):
         return dt
 
     normalized = date_str.strip().replace("Z", "+0000")
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = WHITESPACE_RE.sub(" ", normalized)
 
     fmts = (
         "%Y-%m-%dT%H:%M:%S%z",
@@ -889,7 +1048,7 @@ def fetch_careratings(feed_config):
                         continue
 
             desc = item.get("Description") or ""
-            desc = re.sub(r'<[^>]+>', '', desc).strip()
+            desc = HTML_TAG_RE.sub('', desc).strip()
             if len(desc) > 300:
                 desc = desc[:300] + "..."
 
@@ -8,6 +8,9 @@
             }
         };
         const MOBILE_BREAKPOINT = 640;
+        // escapeHtml() tables; declared up front because it runs during setup.
+        const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;', '\u00a0': '&nbsp;' };
+        const HTML_ESCAPE_RE = /[&<>"'\u00a0]/g;
 
         // Lazy-load tab data from JSON files
         var _tabDataCache = {};
@@ -39,6 +42,9 @@
             if ((tab === 'twitter') && !TWITTER_ARTICLES) {
                 loads.push(_safeLoad('twitter', 'static/tab_twitter.json', function(d) { TWITTER_ARTICLES = d; }));
             }
+            if (tab === 'twitter' && !TWITTER_HIGH_SIGNAL) {
+                loads.push(_safeLoad('twitter_hs', 'static/tab_twitter_hs.json', function(d) { TWITTER_HIGH_SIGNAL = d; }));
+            }
             if (tab === 'research' && !RESEARCH_REPORTS) {
                 loads.push(_safeLoad('research', 'static/tab_research.json', function(d) { RESEARCH_REPORTS = d; }));
             }
@@ -188,53 +194,70 @@
         let selectedPublishers = new Set();
 
         function initPublisherDropdown() {
-            const list = document.getElementById('dropdown-list');
+            buildDropdownList('dropdown-list', 'pub-', ALL_PUBLISHERS, onPublisherCheckChange);
+        }
+
+        function toggleDropdown() { toggleDropdownById('publisher-dropdown', 'dropdown-search'); }
+
+        // ── Generic dropdown utilities ──────────────────────────────
+        const DROPDOWN_CONFIG = [
+            { ddId: 'publisher-dropdown', searchId: 'dropdown-search', listId: 'dropdown-list' },
+            { ddId: 'tg-channel-dropdown', searchId: 'tg-dropdown-search', listId: 'tg-dropdown-list' },
+            { ddId: 'research-publisher-dropdown', searchId: 'research-dropdown-search', listId: 'research-dropdown-list' },
+            { ddId: 'youtube-publisher-dropdown', searchId: 'youtube-dropdown-search', listId: 'youtube-dropdown-list' },
+            { ddId: 'twitter-publisher-dropdown', searchId: 'twitter-dropdown-search', listId: 'twitter-dropdown-list' },
+        ];
+        // ddIds of the dropdowns currently open, so the document-wide click and
+        // Escape handlers only look up those instead of all of them per event.
+        const openDropdowns = new Set();
+
+        // Fills a dropdown list with one checkbox row per name; onChange(name, checked)
+        // runs whether the box or the rest of the row is clicked.
+        function buildDropdownList(listId, idPrefix, names, onChange) {
+            const list = document.getElementById(listId);
+            if (!list) return;
             list.innerHTML = '';
-            ALL_PUBLISHERS.forEach(pub => {
+            names.forEach(name => {
                 const item = document.createElement('div');
                 item.className = 'dropdown-item';
-                item.dataset.publisher = pub;
+                item.dataset.publisher = name;
                 const cb = document.createElement('input');
                 cb.type = 'checkbox';
-                cb.id = 'pub-' + pub.replace(/\s+/g, '-');
-                cb.dataset.publisher = pub;
-                cb.addEventListener('change', () => onPublisherCheckChange(pub, cb.checked));
+                cb.id = idPrefix + name.replace(/\s+/g, '-');
+                cb.dataset.publisher = name;
+                cb.addEventListener('change', () => onChange(name, cb.checked));
                 const lbl = document.createElement('label');
                 lbl.htmlFor = cb.id;
-                lbl.textContent = pub;
+                lbl.textContent = name;
                 item.appendChild(cb);
                 item.appendChild(lbl);
                 item.addEventListener('click', (e) => {
                     if (e.target !== cb) {
                         cb.checked = !cb.checked;
-                        onPublisherCheckChange(pub, cb.checked);
+                        onChange(name, cb.checked);
                     }
                 });
                 list.appendChild(item);
             });
         }
 
-        function toggleDropdown() {
-            const dd = document.getElementById('publisher-dropdown');
-            dd.classList.toggle('open');
-            if (dd.classList.contains('open')) {
-                document.getElementById('dropdown-search').focus();
+        function toggleDropdownById(ddId, searchId) {
+            const dd = document.getElementById(ddId);
+            if (dd.classList.toggle('open')) {
+                openDropdowns.add(ddId);
+                document.getElementById(searchId).focus();
+            } else {
+                openDropdowns.delete(ddId);
             }
         }
 
-        // ── Generic dropdown utilities ──────────────────────────────
-        const DROPDOWN_CONFIG = [
-            { ddId: 'publisher-dropdown', searchId: 'dropdown-search', listId: 'dropdown-list' },
-            { ddId: 'tg-channel-dropdown', searchId: 'tg-dropdown-search', listId: 'tg-dropdown-list' },
-            { ddId: 'research-publisher-dropdown', searchId: 'research-dropdown-search', listId: 'research-dropdown-list' },
-            { ddId: 'youtube-publisher-dropdown', searchId: 'youtube-dropdown-search', listId: 'youtube-dropdown-list' },
-            { ddId: 'twitter-publisher-dropdown', searchId: 'twitter-dropdown-search', listId: 'twitter-dropdown-list' },
-        ];
-
         function filterDropdownList(searchInputId, listId) {
             const query = document.getElementById(searchInputId).value.toLowerCase();
-            document.querySelectorAll('#' + listId + ' .dropdown-item').forEach(item => {
-                item.classList.toggle('hidden', query && !item.dataset.publisher.toLowerCase().includes(query));
+            // Clearing (which every dropdown close does) only has to revisit the
+            // items a previous query hid, not the whole publisher list.
+            const selector = '#' + listId + (query ? ' .dropdown-item' : ' .dropdown-item.hidden');
+            document.querySelectorAll(selector).forEach(item => {
+                item.classList.toggle('hidden', !!query && !item.dataset.publisher.toLowerCase().includes(query));
             });
         }
 
@@ -242,12 +265,15 @@
             const dd = document.getElementById(ddId);
             if (!dd || !dd.classList.contains('open')) return;
             dd.classList.remove('open');
+            openDropdowns.delete(ddId);
             const search = document.getElementById(searchId);
             if (search) { search.value = ''; filterDropdownList(searchId, listId); }
         }
 
         function closeAllDropdowns() {
-            DROPDOWN_CONFIG.forEach(d => closeDropdownById(d.ddId, d.searchId, d.listId));
+            DROPDOWN_CONFIG.forEach(d => {
+                if (openDropdowns.has(d.ddId)) closeDropdownById(d.ddId, d.searchId, d.listId);
+            });
         }
         // ────────────────────────────────────────────────────────────
 
@@ -307,7 +333,7 @@
         }
 
         function syncPresetButtons() {
-            document.querySelectorAll('.preset-btn').forEach(btn => {
+            document.querySelectorAll('.preset-btn[data-preset]').forEach(btn => {
                 const name = btn.dataset.preset;
                 const pubs = PUBLISHER_PRESETS[name];
                 if (!pubs) return;
@@ -333,10 +359,16 @@
             'official-channels': ["RBI", "SEBI", "ECB", "ADB", "FRED", "PIB", "MoSPI"]
         };
 
+        // ALL_PUBLISHERS is fixed for the page's lifetime, so each desk's
+        // substring match against it is resolved once and reused by every
+        // click and every syncDeskButtons() pass.
+        const resolvedDeskPubs = {};
+
         function resolveDeskPubs(deskKey) {
+            if (resolvedDeskPubs[deskKey]) return resolvedDeskPubs[deskKey];
             const deskNames = NEWS_DESKS[deskKey];
             if (!deskNames) return [];
-            return ALL_PUBLISHERS.filter(p => deskNames.some(d => p.includes(d)));
+            return (resolvedDeskPubs[deskKey] = ALL_PUBLISHERS.filter(p => deskNames.some(d => p.includes(d))));
         }
 
         function syncDeskButtons() {
@@ -416,36 +448,52 @@
             }
         }
 
+        // Lowercased search text per news row, parallel to NEWS_ARTICLES; built
+        // once when the feed arrives so keystrokes only run indexOf.
+        let newsSearchIndex = [];
+        let newsSearchSource = null;
+        // Last filter run (row positions that matched). Typing only ever narrows
+        // a query, so when the new one extends it under the same publisher and
+        // in-focus settings, just those rows are rescanned.
+        let newsFilterMemo = null;
+
+        function newsSearchText(a) {
+            const related = (a.related_sources || []).map(rs => rs.name).join(' ');
+            return (a.title + ' ' + a.source + ' ' + (a.time || '') + ' ' + related).toLowerCase();
+        }
+
         function filterArticles() {
             const query = document.getElementById('search-input').value.toLowerCase();
-            const articles = document.querySelectorAll('.article');
-            const dateHeaders = document.querySelectorAll('.date-header');
-
-            articles.forEach(article => {
-                const text = article.textContent.toLowerCase();
-                const publisher = article.dataset.publisher || '';
-                const isInFocus = article.dataset.inFocus === 'true';
-                const matchesSearch = !query || text.includes(query);
-                const matchesPublisher = selectedPublishers.size === 0 || selectedPublishers.has(publisher);
-                const matchesInFocus = !inFocusOnly || isInFocus;
-                article.classList.toggle('hidden', !(matchesSearch && matchesPublisher && matchesInFocus));
-            });
-
-            // Hide empty date headers
-            dateHeaders.forEach(header => {
-                let next = header.nextElementSibling;
-                let hasVisible = false;
-                while (next && !next.classList.contains('date-header')) {
-                    if (next.classList.contains('article') && !next.classList.contains('hidden')) {
-                        hasVisible = true;
-                        break;
-                    }
-                    next = next.nextElementSibling;
+            const articles = NEWS_ARTICLES || [];
+            if (newsSearchSource !== articles) {
+                newsSearchIndex = articles.map(newsSearchText);
+                newsSearchSource = articles;
+            }
+            const byPublisher = selectedPublishers.size > 0;
+            const filterKey = (inFocusOnly ? '1' : '0') + [...selectedPublishers].join('\u0001');
+            const memo = newsFilterMemo;
+            const narrowing = memo && memo.source === articles && memo.key === filterKey && query.startsWith(memo.query);
+            const candidates = narrowing ? memo.matches : null;
+            const total = candidates ? candidates.length : articles.length;
+            const matches = [];
+            for (let n = 0; n < total; n++) {
+                const i = candidates ? candidates[n] : n;
+                const a = articles[i];
+                if (!candidates) {
+                    if (byPublisher && !selectedPublishers.has(a.publisher || '')) continue;
+                    if (inFocusOnly && !a.in_focus) continue;
                 }
-                header.classList.toggle('hidden', !hasVisible);
-            });
-
-            setPageToToday();
+                if (query && newsSearchIndex[i].indexOf(query) === -1) continue;
+                matches.push(i);
+            }
+            newsFilterMemo = { source: articles, key: filterKey, query, matches };
+            filteredNews = matches.map(i => articles[i]);
+            if (pendingNewsPage) {
+                currentPage = pendingNewsPage;
+                pendingNewsPage = 0;
+            } else {
+                setPageToToday();
+            }
             applyPagination();
         }
 
@@ -458,7 +506,9 @@
 
         // Close dropdown on outside click
         document.addEventListener('click', (e) => {
+            if (!openDropdowns.size) return;
             DROPDOWN_CONFIG.forEach(d => {
+                if (!openDropdowns.has(d.ddId)) return;
                 const dd = document.getElementById(d.ddId);
                 if (dd && dd.classList.contains('open') && !dd.contains(e.target)) {
                     closeDropdownById(d.ddId, d.searchId, d.listId);
@@ -468,8 +518,9 @@
 
         // Close dropdown on Escape
         document.addEventListener('keydown', (e) => {
-            if (e.key === 'Escape') {
+            if (e.key === 'Escape' && openDropdowns.size) {
                 for (const d of DROPDOWN_CONFIG) {
+                    if (!openDropdowns.has(d.ddId)) continue;
                     const dd = document.getElementById(d.ddId);
                     if (dd && dd.classList.contains('open')) {
                         closeDropdownById(d.ddId, d.searchId, d.listId);
@@ -489,16 +540,50 @@
         let currentPage = 1;
         // TODAY_ISO is injected by inline script in aggregator.py
 
-        function getFilteredArticles() {
-            return [...document.querySelectorAll('.article:not(.hidden)')];
-        }
+        // News rows matching the current search/publisher/in-focus filters;
+        // only the current page of them is in the DOM.
+        let filteredNews = [];
+        // Page picked on the server-rendered paginator before the news JSON
+        // arrived; the first filter run opens it instead of today's page.
+        let pendingNewsPage = 0;
+        // The <article> rows of the current news page, kept from the last render.
+        let newsRows = [];
 
         // ── Generic pagination builder ──────────────────────────────
-        function buildPagination(containerId, activePage, totalPages, onPageChange) {
+        // One delegated click listener per container; buttons only carry
+        // data-page. The news paginator's first render is shipped pre-built
+        // by aggregator.py in the same markup, so it is clickable as-is, and
+        // its data-shown holds the "page/total" it was built for.
+        const paginationHandlers = {};
+        // "page/total" each container was last built for; filtering often
+        // re-renders the same page, and then the buttons are left as they are.
+        const paginationShown = {};
+
+        function bindPagination(containerId, onPageChange) {
             const container = document.getElementById(containerId);
+            if (!container) return null;
+            if (!paginationHandlers[containerId]) {
+                container.addEventListener('click', (e) => {
+                    const btn = e.target.closest('.page-btn[data-page]');
+                    if (!btn || btn.disabled || !container.contains(btn)) return;
+                    paginationHandlers[containerId](parseInt(btn.dataset.page, 10));
+                });
+            }
+            paginationHandlers[containerId] = onPageChange;
+            return container;
+        }
+
+        function buildPagination(containerId, activePage, totalPages, onPageChange) {
+            const container = bindPagination(containerId, onPageChange);
             if (!container) return;
-            container.innerHTML = '';
-            if (totalPages <= 1) return;
+            const shown = activePage + '/' + totalPages;
+            if ((paginationShown[containerId] || container.dataset.shown) === shown) return;
+            paginationShown[containerId] = shown;
+            if (totalPages <= 1) {
+                container.replaceChildren();
+                return;
+            }
+            const frag = document.createDocumentFragment();
 
             const makeBtn = (label, page, isActive = false, isDisabled = false) => {
                 const btn = document.createElement('button');
@@ -507,7 +592,7 @@
                 if (isDisabled) {
                     btn.disabled = true;
                 } else if (!isActive) {
-                    btn.addEventListener('click', () => onPageChange(page));
+                    btn.dataset.page = page;
                 }
                 return btn;
             };
@@ -517,7 +602,7 @@
                 span.textContent = '\u2026';
                 return span;
             };
-            const windowSize = 7;
+            const windowSize = (typeof PAGINATION_WINDOW === 'number') ? PAGINATION_WINDOW : 7;
             const half = Math.floor(windowSize / 2);
             let start = Math.max(1, activePage - half);
             let end = Math.min(totalPages, activePage + half);
@@ -528,64 +613,54 @@
 
             const prevBtn = makeBtn('\u2190 Prev', Math.max(1, activePage - 1), false, activePage === 1);
             prevBtn.classList.add('nav', 'prev');
-            container.appendChild(prevBtn);
+            frag.appendChild(prevBtn);
             if (start > 1) {
-                container.appendChild(makeBtn('1', 1, activePage === 1));
-                if (start > 2) container.appendChild(makeEllipsis());
+                frag.appendChild(makeBtn('1', 1, activePage === 1));
+                if (start > 2) frag.appendChild(makeEllipsis());
             }
             for (let i = start; i <= end; i++) {
-                container.appendChild(makeBtn(String(i), i, i === activePage));
+                frag.appendChild(makeBtn(String(i), i, i === activePage));
             }
             if (end < totalPages) {
-                if (end < totalPages - 1) container.appendChild(makeEllipsis());
-                container.appendChild(makeBtn(String(totalPages), totalPages, activePage === totalPages));
+                if (end < totalPages - 1) frag.appendChild(makeEllipsis());
+                frag.appendChild(makeBtn(String(totalPages), totalPages, activePage === totalPages));
             }
             const nextBtn = makeBtn('Next \u2192', Math.min(totalPages, activePage + 1), false, activePage === totalPages);
             nextBtn.classList.add('nav', 'next');
-            container.appendChild(nextBtn);
+            frag.appendChild(nextBtn);
+            container.replaceChildren(frag);
         }
         // ────────────────────────────────────────────────────────────
 
+        function onNewsPageChange(page) {
+            currentPage = page;
+            if (!NEWS_ARTICLES) pendingNewsPage = page;
+            applyPagination(true);
+        }
+
         function renderPagination(totalPages) {
-            buildPagination('pagination-bottom', currentPage, totalPages, (page) => {
-                currentPage = page;
-                applyPagination(true);
-            });
+            buildPagination('pagination-bottom', currentPage, totalPages, onNewsPageChange);
         }
 
         function applyPagination(shouldScroll = false) {
-            const articles = getFilteredArticles();
-            const totalPages = Math.max(1, Math.ceil(articles.length / PAGE_SIZE));
+            // Until the news JSON arrives there are no rows to page; keep the
+            // server-rendered paginator, moving it to a page picked on it.
+            if (!NEWS_ARTICLES) {
+                const pager = bindPagination('pagination-bottom', onNewsPageChange);
+                const total = pager ? parseInt((pager.dataset.shown || '').split('/')[1], 10) : 0;
+                if (pendingNewsPage && total) {
+                    buildPagination('pagination-bottom', pendingNewsPage, total, onNewsPageChange);
+                    if (shouldScroll) window.scrollTo(0, 0);
+                }
+                return;
+            }
+            const totalPages = Math.max(1, Math.ceil(filteredNews.length / PAGE_SIZE));
             if (currentPage > totalPages) {
                 currentPage = totalPages;
             }
 
-            // Reset pagination visibility
-            document.querySelectorAll('.article').forEach(a => a.classList.remove('paged-hidden'));
-
             const start = (currentPage - 1) * PAGE_SIZE;
-            const end = start + PAGE_SIZE;
-            articles.forEach((article, idx) => {
-                if (idx < start || idx >= end) {
-                    article.classList.add('paged-hidden');
-                }
-            });
-
-            // Hide empty date headers after paging
-            const dateHeaders = document.querySelectorAll('.date-header');
-            dateHeaders.forEach(header => {
-                let next = header.nextElementSibling;
-                let hasVisible = false;
-                while (next && !next.classList.contains('date-header')) {
-                    if (next.classList.contains('article') && !next.classList.contains('hidden') && !next.classList.contains('paged-hidden')) {
-                        hasVisible = true;
-                        break;
-                    }
-                    next = next.nextElementSibling;
-                }
-                header.classList.toggle('hidden', !hasVisible);
-            });
-
+            renderNewsRows(filteredNews.slice(start, start + PAGE_SIZE));
             renderPagination(totalPages);
             try { localStorage.setItem('financeradar_page', currentPage); } catch(e) {}
             if (shouldScroll) {
@@ -594,12 +669,11 @@
         }
 
         function setPageToToday() {
-            const articles = getFilteredArticles();
             if (!TODAY_ISO) {
                 currentPage = 1;
                 return;
             }
-            const idx = articles.findIndex(a => (a.dataset.date || '') === TODAY_ISO);
+            const idx = filteredNews.findIndex(a => (a.date || '').slice(0, 10) === TODAY_ISO);
             if (idx >= 0) {
                 currentPage = Math.floor(idx / PAGE_SIZE) + 1;
             } else {
@@ -620,7 +694,7 @@
 
         // Keyboard navigation
         let currentArticle = -1;
-        const getVisibleArticles = () => [...document.querySelectorAll('.article:not(.hidden):not(.paged-hidden)')];
+        const getVisibleArticles = () => newsRows;
 
         document.addEventListener('keydown', (e) => {
             // Don't interfere with typing in search
@@ -631,14 +705,14 @@
                 return;
             }
 
-            const articles = getVisibleArticles();
-
             if (e.key === 'j' || e.key === 'ArrowDown') {
+                const articles = getVisibleArticles();
                 e.preventDefault();
                 currentArticle = Math.min(currentArticle + 1, articles.length - 1);
                 articles[currentArticle]?.scrollIntoView({ behavior: 'smooth', block: 'center' });
                 articles[currentArticle]?.querySelector('a')?.focus();
             } else if (e.key === 'k' || e.key === 'ArrowUp') {
+                const articles = getVisibleArticles();
                 e.preventDefault();
                 currentArticle = Math.max(currentArticle - 1, 0);
                 articles[currentArticle]?.scrollIntoView({ behavior: 'smooth', block: 'center' });
@@ -678,25 +752,74 @@
         }
         applyPagination();
 
+        // Buttons rendered per row (bookmarks, show-more, chips) carry a
+        // data-action instead of an inline onclick, so the parser does not
+        // compile a handler for each one; this single listener dispatches them.
+        const ROW_ACTIONS = {
+            'bookmark': toggleGenericBookmark,
+            'bookmark-article': toggleBookmark,
+            'bookmark-report': toggleReportBookmark,
+            'expand-cluster': toggleClusterExpand,
+            'expand-report': toggleReportExpand,
+            'expand-tweet': toggleTweetExpand,
+            'report-images': openReportImageLightboxFromButton,
+            'company-cap': toggleCompanyCap,
+            'company-cat': toggleCompanyCat,
+            'remove-bookmark': btn => removeBookmark(btn.dataset.url),
+            'remove-story': btn => removeStoryBookmark(btn.dataset.storyId),
+            'remove-wsw-bookmark': btn => removeWswBookmark(btn.dataset.wswId)
+        };
+        document.addEventListener('click', (e) => {
+            const btn = e.target.closest('[data-action]');
+            const action = btn && ROW_ACTIONS[btn.dataset.action];
+            if (action) action(btn);
+        });
+
         // ==================== BOOKMARKS ====================
         const BOOKMARKS_KEY = 'financeradar_bookmarks';
         const WSW_BOOKMARKS_KEY = 'financeradar_wsw_bookmarks';
 
+        // Parsed bookmark list, shared by every reader until another tab
+        // changes it. Writes land in the cache at once and reach storage in
+        // one setItem per task, however many toggles ran in it.
+        let bookmarksCache = null;
+        let bookmarksSavePending = false;
+        // URLs of bookmarksCache, rebuilt on the first lookup after a change.
+        let bookmarkedUrlsCache = null;
+
         function getBookmarks() {
+            if (bookmarksCache) return bookmarksCache;
             try {
                 const data = localStorage.getItem(BOOKMARKS_KEY);
-                return data ? JSON.parse(data) : [];
+                bookmarksCache = data ? JSON.parse(data) : [];
             } catch (e) {
-                return [];
+                bookmarksCache = [];
             }
+            return bookmarksCache;
+        }
+
+        function getBookmarkedUrls() {
+            if (!bookmarkedUrlsCache) bookmarkedUrlsCache = new Set(getBookmarks().map(b => b.url));
+            return bookmarkedUrlsCache;
         }
 
         function saveBookmarks(bookmarks) {
-            try {
-                localStorage.setItem(BOOKMARKS_KEY, JSON.stringify(bookmarks));
-            } catch (e) { /* no-op */ }
+            bookmarksCache = bookmarks;
+            bookmarkedUrlsCache = null;
+            if (bookmarksSavePending) return;
+            bookmarksSavePending = true;
+            queueMicrotask(() => {
+                bookmarksSavePending = false;
+                try {
+                    localStorage.setItem(BOOKMARKS_KEY, JSON.stringify(bookmarksCache));
+                } catch (e) { /* no-op */ }
+            });
         }
 
+        window.addEventListener('storage', e => {
+            if (e.key === BOOKMARKS_KEY || e.key === null) bookmarksCache = bookmarkedUrlsCache = null;
+        });
+
         function toggleBookmark(btn) {
             const article = btn.closest('.article');
             btn.dataset.url = article.dataset.url;
@@ -714,14 +837,9 @@
             if (badge) badge.textContent = count;
         }
 
+        // News rows carry their bookmarked state from renderNewsRows(); only the
+        // header count needs setting up front.
         function initBookmarkButtons() {
-            document.querySelectorAll('.article').forEach(article => {
-                const url = article.dataset.url;
-                const btn = article.querySelector('.bookmark-btn');
-                if (btn && isBookmarked(url)) {
-                    btn.classList.add('bookmarked');
-                }
-            });
             updateBookmarkCount();
         }
 
@@ -731,10 +849,8 @@
             const source = btn.dataset.source || '';
 
             let bookmarks = getBookmarks();
-            const idx = bookmarks.findIndex(b => b.url === url);
-
-            if (idx >= 0) {
-                bookmarks.splice(idx, 1);
+            if (getBookmarkedUrls().has(url)) {
+                bookmarks.splice(bookmarks.findIndex(b => b.url === url), 1);
                 btn.classList.remove('bookmarked');
             } else {
                 bookmarks.unshift({ url, title, source, addedAt: Date.now() });
@@ -748,8 +864,7 @@
         }
 
         function syncBookmarkState() {
-            const bookmarks = getBookmarks();
-            const urls = new Set(bookmarks.map(b => b.url));
+            const urls = getBookmarkedUrls();
             document.querySelectorAll('.bookmark-btn[data-url]').forEach(btn => {
                 btn.classList.toggle('bookmarked', urls.has(btn.dataset.url));
             });
@@ -797,7 +912,7 @@
                     }).join('');
                     return '<div class="bk-story-bundle">'
                         + '<div class="bk-story-header"><span class="bk-story-label">' + escapeHtml(s.storyLabel) + '</span>'
-                        + '<button class="bk-remove" onclick="removeStoryBookmark(\'' + escapeForAttr(s.storyId) + '\')" title="Remove">&times;</button></div>'
+                        + '<button class="bk-remove" data-action="remove-story" data-story-id="' + escapeForAttr(s.storyId) + '" title="Remove">&times;</button></div>'
                         + articleItems + '</div>';
                 }).join('');
             }
@@ -805,21 +920,22 @@
             // Individual bookmarks
             if (bookmarks.length > 0) {
                 html += bookmarks.map(function(b) {
-                    return '<div class="bk-saved-item"><div><a href="' + escapeHtml(b.url) + '" target="_blank" rel="noopener">' + escapeHtml(b.title) + '</a><span class="bk-saved-src">' + escapeHtml(b.source) + '</span></div><button class="bk-remove" onclick="removeBookmark(\'' + escapeForAttr(b.url) + '\')" title="Remove">&times;</button></div>';
+                    return '<div class="bk-saved-item"><div><a href="' + escapeHtml(b.url) + '" target="_blank" rel="noopener">' + escapeHtml(b.title) + '</a><span class="bk-saved-src">' + escapeHtml(b.source) + '</span></div><button class="bk-remove" data-action="remove-bookmark" data-url="' + escapeForAttr(b.url) + '" title="Remove">&times;</button></div>';
                 }).join('');
             }
 
             container.innerHTML = html;
         }
 
+        // One regex pass over a lookup table. Quotes are escaped too, so the
+        // result is safe in element text and in quoted attributes alike.
         function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text || '';
-            return div.innerHTML;
+            return text ? String(text).replace(HTML_ESCAPE_RE, ch => HTML_ESCAPES[ch]) : '';
         }
 
+        // Attribute call sites keep their own name; escapeHtml already covers quotes.
         function escapeForAttr(text) {
-            return escapeHtml(text).replace(/'/g, '&#39;');
+            return escapeHtml(text);
         }
 
         function sanitizeUrl(url) {
@@ -880,7 +996,6 @@
             var storyBookmarks = getStoryBookmarks().filter(function(s) { return s.storyId !== storyId; });
             saveStoryBookmarks(storyBookmarks);
             updateBookmarkCount();
-            syncStoryBookmarkState();
             renderSidebarContent();
         }
 
@@ -936,6 +1051,9 @@
             if (!confirm('Are you sure you want to clear all bookmarks?')) return;
             saveBookmarks([]);
             saveStoryBookmarks([]);
+            // Lists render one page at a time, so this sweep only sees a page's
+            // worth. Story bundles have no row button; the sidebar re-render
+            // below is all they need.
             document.querySelectorAll('.bookmark-btn.bookmarked').forEach(btn => {
                 btn.classList.remove('bookmarked');
             });
@@ -1003,14 +1121,6 @@
             renderSidebarContent();
         }
 
-        function syncStoryBookmarkState() {
-            var bookmarks = getStoryBookmarks();
-            var ids = new Set(bookmarks.map(function(s) { return s.storyId; }));
-            document.querySelectorAll('.btn-bk-story[data-story-id]').forEach(function(btn) {
-                btn.classList.toggle('bookmarked', ids.has(btn.dataset.storyId));
-            });
-        }
-
         // Bookmark panel toggle
         var bkToggleBtn = document.getElementById('bk-toggle');
         if (bkToggleBtn) bkToggleBtn.addEventListener('click', function() {
@@ -1342,8 +1452,7 @@
         // (AI sidebar functions removed — homepage now uses merged AI rankings directly)
 
         function isBookmarked(url) {
-            if (!url) return false;
-            return getBookmarks().some(b => b.url === url);
+            return !!url && getBookmarkedUrls().has(url);
         }
 
         // (toggleAiBookmark removed — AI sidebar no longer exists)
@@ -1480,13 +1589,11 @@
         }
 
         function updateWswBookmarkCount() {
-            const count = getWswBookmarks().length;
             const badge = document.getElementById('wsw-bookmark-count');
-            const toggle = document.getElementById('wsw-toggle');
-            if (!badge || !toggle) return;
+            if (!badge) return;
+            const count = getWswBookmarks().length;
             badge.textContent = count;
             badge.classList.toggle('hidden', count === 0);
-            toggle.classList.toggle('has-bookmarks', count > 0);
         }
 
         function updateWswViewPills() {
@@ -1624,7 +1731,7 @@
                         ${b.indiaRelevance ? `<div class="wsw-bookmark-india">${escapeHtml(b.indiaRelevance)}</div>` : ''}
                         <div class="sidebar-article-meta">
                             <span class="sidebar-article-source">${sourceParts.join(' · ')}</span>
-                            <button class="sidebar-remove" onclick="removeWswBookmark('${escapeForAttr(b.id)}')" title="Remove bookmark">✕</button>
+                            <button class="sidebar-remove" data-action="remove-wsw-bookmark" data-wsw-id="${escapeForAttr(b.id)}" title="Remove bookmark">✕</button>
                         </div>
                     </div>
                 `;
@@ -1673,9 +1780,7 @@
                                 data-provider-key="${escapeForAttr(bookmark.providerKey)}"
                                 data-provider-name="${escapeForAttr(bookmark.providerName)}"
                                 title="Bookmark WSW idea"
-                                aria-label="Bookmark WSW idea">
-                            <svg viewBox="0 0 24 24"><path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"></path></svg>
-                        </button>
+                                aria-label="Bookmark WSW idea"></button>
                     </div>
                 `;
             }).join('');
@@ -1777,7 +1882,6 @@
         // ==================== HOME TAB (vars) ====================
         // These vars must be assigned BEFORE the switchTab('home') IIFE below,
         // because renderHomeTab() is called synchronously during initialization.
-        var BOOKMARK_SVG = '<svg viewBox="0 0 24 24"><path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"></path></svg>';
         var BUCKET_COLORS = {
             news: '#4A8F7A', telegram: '#5E6A96', reports: '#9A8345',
             twitter: '#4A8A9A', youtube: '#A86565', papers: '#7A6B8F'
@@ -1796,6 +1900,15 @@
         let selectedTgChannels = new Set();
         let reportsPage = 1;
         const REPORTS_PAGE_SIZE = 20;
+        const REPORT_PREVIEW_CHARS = 400;
+        const REPORT_PREVIEW_LINES = 5;
+        const REPORT_STOCK_TARGET_RE = /upside|downside|TP\s+\d|target\s+price/i;
+        const REPORT_PDF_LINK_RE = /https?:\/\/\S+\.pdf(\b|\?)/i;
+        // Lowercased text, channel and document titles per report, parallel to
+        // TELEGRAM_REPORTS; the unit separator keeps a query from matching
+        // across two fields.
+        let reportsSearchIndex = [];
+        let reportsSearchSource = null;
         let reportImageLightboxEl = null;
         let reportImageLightboxImgEl = null;
         let reportImageLightboxErrorEl = null;
@@ -1845,6 +1958,7 @@
         let filteredTwitter = [];
         let twitterPage = 1;
         const TWITTER_PAGE_SIZE = 30;
+        const TWEET_PREVIEW_CHARS = 560;
         let selectedTwitterPublishers = new Set();
         let twitterLane = safeStorage.get('financeradar_twitter_lane') || 'high-signal';
         let activeTab = 'home';
@@ -2140,8 +2254,7 @@
                 + ' data-url="' + escapeForAttr(url) + '"'
                 + ' data-title="' + escapeForAttr(title) + '"'
                 + ' data-source="' + escapeForAttr(source || 'Home') + '"'
-                + ' onclick="toggleGenericBookmark(this)" aria-label="Bookmark">'
-                + BOOKMARK_SVG + '</button>';
+                + ' data-action="bookmark" aria-label="Bookmark"></button>';
         }
 
         function catMeta(item, bk) {
@@ -2536,8 +2649,7 @@
                     + ' data-url="' + escapeForAttr(aUrl) + '"'
                     + ' data-title="' + escapeForAttr(aTitle) + '"'
                     + ' data-source="' + escapeForAttr(a.source || 'Home') + '"'
-                    + ' onclick="toggleGenericBookmark(this)" aria-label="Bookmark">'
-                    + BOOKMARK_SVG + '</button>' : '';
+                    + ' data-action="bookmark" aria-label="Bookmark"></button>' : '';
                 var aLinkHtml = aUrl
                     ? '<a class="cluster-sub-link" href="' + escapeForAttr(aUrl) + '" target="_blank" rel="noopener">' + aTitle + '</a>'
                     : '<span class="cluster-sub-link">' + aTitle + '</span>';
@@ -2552,7 +2664,7 @@
                     + '</div>'
                     + aBk + '</div>';
             }).join('')
-            + (needsCollapse ? '<button class="cluster-show-more" type="button" onclick="toggleClusterExpand(this)">+ '
+            + (needsCollapse ? '<button class="cluster-show-more" type="button" data-action="expand-cluster">+ '
                 + (articles.length - CLUSTER_VISIBLE) + ' more sources</button>' : '')
             + '</div>';
 
@@ -2802,28 +2914,51 @@
             return date.toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric' });
         }
 
+        // First news render: the list itself is drawn a page at a time by
+        // applyPagination() from filteredNews, so only drop the skeleton here.
         function renderNewsFromJSON() {
             if (!NEWS_ARTICLES) return;
+            filteredNews = NEWS_ARTICLES.slice();
+            var newsLoading = document.getElementById('news-loading');
+            if (newsLoading) newsLoading.remove();
+        }
+
+        function renderNewsRows(items) {
             var container = document.getElementById('news-list');
             if (!container) return;
             var html = '';
+            var bookmarkedUrls = getBookmarkedUrls();
             var lastDateLabel = '';
             var now = new Date();
             var todayStr = now.toISOString().slice(0, 10);
             var yest = new Date(now);
             yest.setDate(yest.getDate() - 1);
             var yesterdayStr = yest.toISOString().slice(0, 10);
-
-            NEWS_ARTICLES.forEach(function(a) {
+            var days = ['Sunday','Monday','Tuesday','Wednesday','Thursday','Friday','Saturday'];
+            var months = ['January','February','March','April','May','June','July','August','September','October','November','December'];
+            // A few dozen sources and publishers cover hundreds of rows, so their
+            // escaped forms are built once per render and reused.
+            var sourceCache = Object.create(null);
+            var publisherCache = Object.create(null);
+            var relatedCache = Object.create(null);
+            // Times repeat across rows too, and every row ends the same way.
+            var timeCache = Object.create(null);
+            var metaDot = '<span class="meta-dot">\u00b7</span>';
+            var metaTail = '" data-action="bookmark-article" aria-label="Bookmark article" title="Bookmark"></button></div>';
+            // Only a handful of distinct days appear, so each header label is
+            // formatted once; it is derived from the feed's own calendar date so
+            // every article keyed to that day gets the same header.
+            var dateLabels = Object.create(null);
+            dateLabels[''] = '';
+            dateLabels[todayStr] = 'Today';
+            dateLabels[yesterdayStr] = 'Yesterday';
+
+            items.forEach(function(a) {
                 var dateStr = a.date ? a.date.slice(0, 10) : '';
-                var dateLabel = '';
-                if (dateStr === todayStr) dateLabel = 'Today';
-                else if (dateStr === yesterdayStr) dateLabel = 'Yesterday';
-                else if (a.date) {
-                    var d = new Date(a.date);
-                    var days = ['Sunday','Monday','Tuesday','Wednesday','Thursday','Friday','Saturday'];
-                    var months = ['January','February','March','April','May','June','July','August','September','October','November','December'];
-                    dateLabel = days[d.getDay()] + ', ' + months[d.getMonth()] + ' ' + String(d.getDate()).padStart(2, '0');
+                var dateLabel = dateLabels[dateStr];
+                if (dateLabel === undefined) {
+                    var d = new Date(Date.UTC(+dateStr.slice(0, 4), +dateStr.slice(5, 7) - 1, +dateStr.slice(8, 10)));
+                    dateLabel = dateLabels[dateStr] = days[d.getUTCDay()] + ', ' + months[d.getUTCMonth()] + ' ' + dateStr.slice(8, 10);
                 }
                 if (dateLabel && dateLabel !== lastDateLabel) {
                     html += '<h2 class="date-header">' + escapeHtml(dateLabel) + '</h2>\n';
@@ -2836,34 +2971,47 @@
                     var total = a.related_sources.length + 1;
                     sourceBadge = '<span class="source-badge">' + total + ' sources</span>';
                     var links = a.related_sources.map(function(rs) {
-                        var name = escapeHtml(rs.name);
-                        var display = name.length > 25 ? name.slice(0, 25) + '...' : name;
-                        return '<a href="' + escapeForAttr(rs.link) + '" target="_blank" rel="noopener" title="' + name + '">' + display + '</a>';
+                        var rel = relatedCache[rs.name];
+                        if (!rel) {
+                            var name = rs.name || '';
+                            rel = relatedCache[rs.name] = {
+                                title: escapeHtml(name),
+                                // Truncate before escaping so an entity is never cut in half
+                                display: escapeHtml(name.length > 25 ? name.slice(0, 25) + '...' : name)
+                            };
+                        }
+                        return '<a href="' + escapeForAttr(rs.link) + '" target="_blank" rel="noopener" title="' + rel.title + '">' + rel.display + '</a>';
                     });
                     alsoCovered = '<div class="also-covered">Also covered by: ' + links.join(', ') + '</div>';
                 }
 
-                var sourceDisplay = a.source.length > 35 ? escapeHtml(a.source.slice(0, 35)) + '...' : escapeHtml(a.source);
-                var timeHtml = a.time ? '<span class="meta-dot">\u00b7</span><span class="article-time">' + escapeHtml(a.time) + '</span>' : '';
-
-                html += '<article class="article" data-source="' + escapeForAttr(a.source.toLowerCase()) + '" data-date="' + escapeForAttr(dateStr) + '" data-url="' + escapeForAttr(a.link) + '" data-title="' + escapeForAttr(a.title) + '" data-in-focus="' + (a.in_focus ? 'true' : 'false') + '" data-publisher="' + escapeForAttr(a.publisher) + '">'
-                    + '<h3 class="article-title"><a href="' + escapeForAttr(a.link) + '" target="_blank" rel="noopener">' + escapeHtml(a.title) + '</a>' + sourceBadge + '</h3>'
+                var src = sourceCache[a.source];
+                if (!src) {
+                    src = sourceCache[a.source] = {
+                        key: escapeForAttr(a.source.toLowerCase()),
+                        title: escapeForAttr(a.source),
+                        display: a.source.length > 35 ? escapeHtml(a.source.slice(0, 35)) + '...' : escapeHtml(a.source)
+                    };
+                }
+                var publisherAttr = publisherCache[a.publisher];
+                if (publisherAttr === undefined) publisherAttr = publisherCache[a.publisher] = escapeForAttr(a.publisher);
+                var timeHtml = a.time ? timeCache[a.time] : '';
+                if (timeHtml === undefined) timeHtml = timeCache[a.time] = metaDot + '<span class="article-time">' + escapeHtml(a.time) + '</span>';
+                var linkAttr = escapeForAttr(a.link);
+                var titleHtml = escapeHtml(a.title);
+
+                html += '<article class="article" data-source="' + src.key + '" data-date="' + escapeForAttr(dateStr) + '" data-url="' + linkAttr + '" data-title="' + titleHtml + '" data-in-focus="' + (a.in_focus ? 'true' : 'false') + '" data-publisher="' + publisherAttr + '">'
+                    + '<h3 class="article-title"><a href="' + linkAttr + '" target="_blank" rel="noopener">' + titleHtml + '</a>' + sourceBadge + '</h3>'
                     + '<div class="article-meta">'
-                    + '<a href="' + escapeForAttr(a.source_url) + '" target="_blank" class="source-tag" title="' + escapeForAttr(a.source) + '">' + sourceDisplay + '</a>'
+                    + '<a href="' + escapeForAttr(a.source_url) + '" target="_blank" class="source-tag" title="' + src.title + '">' + src.display + '</a>'
                     + timeHtml
-                    + '<span class="meta-dot">\u00b7</span>'
-                    + '<button class="bookmark-btn" onclick="toggleBookmark(this)" aria-label="Bookmark article" title="Bookmark">'
-                    + '<svg viewBox="0 0 24 24"><path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"></path></svg>'
-                    + '</button>'
-                    + '</div>'
+                    + metaDot + '<button class="bookmark-btn' + (bookmarkedUrls.has(a.link) ? ' bookmarked' : '') + metaTail
                     + alsoCovered
                     + '</article>\n';
             });
 
             container.innerHTML = html;
-            syncBookmarkState();
-            var newsLoading = document.getElementById('news-loading');
-            if (newsLoading) newsLoading.remove();
+            newsRows = Array.from(container.getElementsByClassName('article'));
         }
 
         function renderMainReports() {
@@ -2882,36 +3030,10 @@
         }
         function initTgChannelDropdown() {
             const channels = [...new Set(TELEGRAM_REPORTS.map(r => r.channel || '').filter(Boolean))].sort();
-            const list = document.getElementById('tg-dropdown-list');
-            if (!list || channels.length === 0) return;
-            list.innerHTML = '';
-            channels.forEach(ch => {
-                const item = document.createElement('div');
-                item.className = 'dropdown-item';
-                item.dataset.publisher = ch;
-                const cb = document.createElement('input');
-                cb.type = 'checkbox';
-                cb.id = 'tgch-' + ch.replace(/\s+/g, '-');
-                cb.dataset.publisher = ch;
-                cb.addEventListener('change', () => onTgChannelChange(ch, cb.checked));
-                const lbl = document.createElement('label');
-                lbl.htmlFor = cb.id;
-                lbl.textContent = ch;
-                item.appendChild(cb);
-                item.appendChild(lbl);
-                item.addEventListener('click', (e) => {
-                    if (e.target !== cb) { cb.checked = !cb.checked; onTgChannelChange(ch, cb.checked); }
-                });
-                list.appendChild(item);
-            });
-        }
-        function toggleTgDropdown() {
-            const dd = document.getElementById('tg-channel-dropdown');
-            dd.classList.toggle('open');
-            if (dd.classList.contains('open')) {
-                document.getElementById('tg-dropdown-search').focus();
-            }
+            if (channels.length === 0) return;
+            buildDropdownList('tg-dropdown-list', 'tgch-', channels, onTgChannelChange);
         }
+        function toggleTgDropdown() { toggleDropdownById('tg-channel-dropdown', 'tg-dropdown-search'); }
         function filterTgChannelList() { filterDropdownList('tg-dropdown-search', 'tg-dropdown-list'); }
         function selectAllTgChannels() {
             selectedTgChannels.clear();
@@ -3131,17 +3253,16 @@
         }
 
         function reportHasStockTarget(r) {
-            const RE = /upside|downside|TP\s+\d|target\s+price/i;
-            if (RE.test(r.text || '')) return true;
+            if (REPORT_STOCK_TARGET_RE.test(r.text || '')) return true;
             const docs = (r.documents && r.documents.length > 0) ? r.documents
                 : (r.document && r.document.title) ? [r.document] : [];
-            return docs.some(d => RE.test(d.title || ''));
+            return docs.some(d => REPORT_STOCK_TARGET_RE.test(d.title || ''));
         }
 
         function reportHasPdf(r) {
             if (r.documents && r.documents.length > 0) return true;
             if (r.document && r.document.title) return true;
-            if (/https?:\/\/\S+\.pdf(\b|\?)/i.test(r.text || '')) return true;
+            if (REPORT_PDF_LINK_RE.test(r.text || '')) return true;
             return false;
         }
 
@@ -3153,34 +3274,30 @@
             return hasText || hasDocs || hasImages;
         }
 
+        function reportSearchText(r) {
+            const docTitle = r.documents && r.documents.length > 0
+                ? r.documents.map(d => d.title || '').join(' ')
+                : (r.document && r.document.title || '');
+            return ((r.text || '') + '\x1f' + (r.channel || '') + '\x1f' + docTitle).toLowerCase();
+        }
+
         function filterReports() {
             const query = document.getElementById('search-input').value.toLowerCase().trim();
-            filteredReports = query
-                ? TELEGRAM_REPORTS.filter(r => {
-                    const text = (r.text || '').toLowerCase();
-                    const channel = (r.channel || '').toLowerCase();
-                    const docTitle = (r.documents && r.documents.length > 0
-                        ? r.documents.map(d => d.title || '').join(' ')
-                        : (r.document && r.document.title || '')).toLowerCase();
-                    return text.includes(query) || channel.includes(query) || docTitle.includes(query);
-                })
-                : [...TELEGRAM_REPORTS];
-            // Exclude fully empty posts only (no text, docs, or images)
-            filteredReports = filteredReports.filter(reportHasContent);
-            // View mode filter
-            if (reportsViewMode === 'pdf') {
-                filteredReports = filteredReports.filter(reportHasPdf);
-            } else if (reportsViewMode === 'nopdf') {
-                filteredReports = filteredReports.filter(r => !reportHasPdf(r));
-            }
-            // Channel filter
-            if (selectedTgChannels.size > 0) {
-                filteredReports = filteredReports.filter(r => selectedTgChannels.has(r.channel || ''));
-            }
-            // No price targets
-            if (reportsNoTargetFilterActive) {
-                filteredReports = filteredReports.filter(r => !reportHasStockTarget(r));
+            if (reportsSearchSource !== TELEGRAM_REPORTS) {
+                reportsSearchIndex = TELEGRAM_REPORTS.map(reportSearchText);
+                reportsSearchSource = TELEGRAM_REPORTS;
             }
+            const byChannel = selectedTgChannels.size > 0;
+            filteredReports = TELEGRAM_REPORTS.filter((r, i) => {
+                if (query && reportsSearchIndex[i].indexOf(query) === -1) return false;
+                // Exclude fully empty posts only (no text, docs, or images)
+                if (!reportHasContent(r)) return false;
+                if (reportsViewMode === 'pdf' && !reportHasPdf(r)) return false;
+                if (reportsViewMode === 'nopdf' && reportHasPdf(r)) return false;
+                if (byChannel && !selectedTgChannels.has(r.channel || '')) return false;
+                // No price targets
+                return !(reportsNoTargetFilterActive && reportHasStockTarget(r));
+            });
             document.getElementById('reports-visible-count').textContent = filteredReports.length;
             reportsPage = 1;
             applyReportsPagination();
@@ -3203,7 +3320,7 @@
 
             let html = '';
             let currentDateHeader = '';
-            const bookmarks = getBookmarks();
+            const bookmarkedUrls = getBookmarkedUrls();
 
             pageReports.forEach(r => {
                 const dateHeader = formatReportDateHeader(r.date);
@@ -3218,9 +3335,10 @@
                 const reportBodyRaw = lines.length > 1 ? lines.slice(1).join('\n') : '';
                 const hasReportTitle = !!reportTitleRaw.trim();
                 const reportTitle = escapeHtml(reportTitleRaw);
-                const text = escapeHtml(reportBodyRaw).replace(/\n/g, '<br>');
+                const preview = previewText(reportBodyRaw, REPORT_PREVIEW_CHARS, REPORT_PREVIEW_LINES);
+                const text = escapeHtml(preview.text).replace(/\n/g, '<br>');
                 const reportUrl = sanitizeUrl(r.url || '');
-                const isBookmarkedReport = bookmarks.some(b => b.url === reportUrl);
+                const isBookmarkedReport = bookmarkedUrls.has(reportUrl);
                 const titleHtml = hasReportTitle
                     ? (reportUrl
                         ? `<a href="${escapeForAttr(reportUrl)}" target="_blank" rel="noopener" class="report-title-link">${reportTitle}</a>`
@@ -3250,14 +3368,14 @@
                     const badge = images.length > 1
                         ? `<span class="report-images-badge">+${images.length - 1} more</span>` : '';
                     const encodedImages = escapeForAttr(JSON.stringify(images));
-                    imgHtml = `<button type="button" class="report-images" onclick="openReportImageLightboxFromButton(this)"
+                    imgHtml = `<button type="button" class="report-images" data-action="report-images"
                         data-report-images='${encodedImages}' data-start-index="0" aria-label="Open report image in fullscreen">
                         <img src="${escapeForAttr(images[0])}" alt="Report image" loading="lazy"
                              onerror="this.onerror=null;this.style.display='none';this.parentElement.classList.add('report-images-fallback')">
                         ${badge}</button>`;
                 }
 
-                const hasPdfLink = /https?:\/\/\S+\.pdf(\b|\?)/i.test(r.text || '');
+                const hasPdfLink = REPORT_PDF_LINK_RE.test(r.text || '');
                 const bookmarkTitleRaw = hasReportTitle
                     ? reportTitleRaw
                     : (docs[0] && docs[0].title ? docs[0].title : '');
@@ -3279,22 +3397,21 @@
                             </div>
                             <div class="report-card-right">
                                 <span class="report-card-date">${formatReportDate(r.date)}</span>
-                                <button class="bookmark-btn${isBookmarkedReport ? ' bookmarked' : ''}" onclick="toggleReportBookmark(this)" aria-label="Bookmark">
-                                    <svg viewBox="0 0 24 24"><path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"></path></svg>
-                                </button>
+                                <button class="bookmark-btn${isBookmarkedReport ? ' bookmarked' : ''}" data-action="bookmark-report" aria-label="Bookmark"></button>
                             </div>
                         </div>
                         ${imgHtml}
                         ${docHtml}
                         ${hasReportTitle ? `<div class="report-title">${titleHtml}</div>` : ''}
-                        ${reportBodyRaw ? `<div class="report-text">${text}</div><button class="report-expand-btn" style="display:none" onclick="toggleReportExpand(this)">Show more</button>` : ''}
+                        ${reportBodyRaw ? (preview.clipped
+                            ? `<div class="report-text" data-full="${escapeForAttr(reportBodyRaw)}">${text}</div><button class="report-expand-btn" data-action="expand-report">Show more</button>`
+                            : `<div class="report-text">${text}</div>`) : ''}
                         ${r.views ? `<div class="report-meta"><span>${escapeHtml(r.views)} views</span></div>` : ''}
                     </div>
                 `;
             });
 
             container.innerHTML = html;
-            requestAnimationFrame(() => checkOverflow(container, '.report-text', '.report-expand-btn'));
             renderReportsPagination(totalPages);
         }
 
@@ -3309,6 +3426,9 @@
         function toggleReportExpand(btn) {
             const textEl = btn.previousElementSibling;
             const isExpanded = textEl.classList.toggle('expanded');
+            const full = textEl.dataset.full || '';
+            const shown = isExpanded ? full : previewText(full, REPORT_PREVIEW_CHARS, REPORT_PREVIEW_LINES).text;
+            textEl.innerHTML = escapeHtml(shown).replace(/\n/g, '<br>');
             btn.textContent = isExpanded ? 'Show less' : 'Show more';
         }
 
@@ -3319,10 +3439,8 @@
             const source = card.dataset.channel;
 
             let bookmarks = getBookmarks();
-            const idx = bookmarks.findIndex(b => b.url === url);
-
-            if (idx >= 0) {
-                bookmarks.splice(idx, 1);
+            if (getBookmarkedUrls().has(url)) {
+                bookmarks.splice(bookmarks.findIndex(b => b.url === url), 1);
                 btn.classList.remove('bookmarked');
             } else {
                 bookmarks.unshift({ url, title, source: source + ' (Telegram)', addedAt: Date.now() });
@@ -3443,9 +3561,7 @@
                             </div>
                             <div class="report-card-right">
                                 ${r.date ? `<span class="report-card-date">${formatResearchDate(r.date)}</span>` : ''}
-                                <button class="bookmark-btn" data-url="${escapeForAttr(cardUrl)}" data-title="${escapeForAttr(r.title)}" data-source="${publisher}" onclick="toggleGenericBookmark(this)" aria-label="Bookmark report" title="Bookmark">
-                                    <svg viewBox="0 0 24 24"><path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"></path></svg>
-                                </button>
+                                <button class="bookmark-btn" data-url="${escapeForAttr(cardUrl)}" data-title="${escapeForAttr(r.title)}" data-source="${publisher}" data-action="bookmark" aria-label="Bookmark report" title="Bookmark"></button>
                             </div>
                         </div>
                         <div class="report-title">${titleHtml}</div>
@@ -3469,31 +3585,7 @@
 
         // Research publisher dropdown
         function initResearchPublisherDropdown() {
-            const list = document.getElementById('research-dropdown-list');
-            if (!list) return;
-            list.innerHTML = '';
-            RESEARCH_PUBLISHERS.forEach(pub => {
-                const item = document.createElement('div');
-                item.className = 'dropdown-item';
-                item.dataset.publisher = pub;
-                const cb = document.createElement('input');
-                cb.type = 'checkbox';
-                cb.id = 'research-pub-' + pub.replace(/\s+/g, '-');
-                cb.dataset.publisher = pub;
-                cb.addEventListener('change', () => onResearchPublisherChange(pub, cb.checked));
-                const lbl = document.createElement('label');
-                lbl.htmlFor = cb.id;
-                lbl.textContent = pub;
-                item.appendChild(cb);
-                item.appendChild(lbl);
-                item.addEventListener('click', (e) => {
-                    if (e.target !== cb) {
-                        cb.checked = !cb.checked;
-                        onResearchPublisherChange(pub, cb.checked);
-                    }
-                });
-                list.appendChild(item);
-            });
+            buildDropdownList('research-dropdown-list', 'research-pub-', RESEARCH_PUBLISHERS, onResearchPublisherChange);
         }
 
         function onResearchPublisherChange(pub, checked) {
@@ -3522,13 +3614,7 @@
             }
         }
 
-        function toggleResearchDropdown() {
-            const dd = document.getElementById('research-publisher-dropdown');
-            dd.classList.toggle('open');
-            if (dd.classList.contains('open')) {
-                document.getElementById('research-dropdown-search').focus();
-            }
-        }
+        function toggleResearchDropdown() { toggleDropdownById('research-publisher-dropdown', 'research-dropdown-search'); }
 
         function closeResearchDropdown() { closeDropdownById('research-publisher-dropdown', 'research-dropdown-search', 'research-dropdown-list'); }
         function filterResearchPublisherList() { filterDropdownList('research-dropdown-search', 'research-dropdown-list'); }
@@ -3583,7 +3669,7 @@
             var box = document.getElementById('companies-cap-filters');
             if (!box || !window.COMPANIES_CAPS) return;
             box.innerHTML = COMPANIES_CAPS.map(function(cap) {
-                return '<button class="company-chip" type="button" data-cap="' + escapeForAttr(cap) + '" onclick="toggleCompanyCap(this)">' + escapeHtml(cap) + '</button>';
+                return '<button class="company-chip" type="button" data-cap="' + escapeForAttr(cap) + '" data-action="company-cap">' + escapeHtml(cap) + '</button>';
             }).join('');
         }
 
@@ -3591,7 +3677,7 @@
             var box = document.getElementById('companies-cat-filters');
             if (!box || !window.COMPANIES_CATEGORIES) return;
             box.innerHTML = COMPANIES_CATEGORIES.map(function(cat) {
-                return '<button class="company-chip company-chip-cat" type="button" data-cat="' + escapeForAttr(cat) + '" onclick="toggleCompanyCat(this)">' + escapeHtml(cat) + '</button>';
+                return '<button class="company-chip company-chip-cat" type="button" data-cat="' + escapeForAttr(cat) + '" data-action="company-cat">' + escapeHtml(cat) + '</button>';
             }).join('');
         }
 
@@ -3682,7 +3768,7 @@
                 var titleHtml = url
                     ? '<a href="' + escapeForAttr(url) + '" target="_blank" rel="noopener" class="company-title">' + title + '</a>'
                     : '<span class="company-title">' + title + '</span>';
-                var bk = '<button class="bookmark-btn" data-url="' + escapeForAttr(url) + '" data-title="' + escapeForAttr(c.title || '') + '" data-source="Tipsheet" onclick="toggleGenericBookmark(this)" aria-label="Bookmark filing" title="Bookmark"><svg viewBox="0 0 24 24"><path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"></path></svg></button>';
+                var bk = '<button class="bookmark-btn" data-url="' + escapeForAttr(url) + '" data-title="' + escapeForAttr(c.title || '') + '" data-source="Tipsheet" data-action="bookmark" aria-label="Bookmark filing" title="Bookmark"></button>';
                 return '<div class="company-card" data-cap="' + escapeForAttr(c.cap || '') + '" data-cat="' + escapeForAttr(c.category || '') + '" data-sector="' + escapeForAttr(c.sector || '') + '">'
                     + '<div class="company-card-head">'
                     + '<div class="company-tags">'
@@ -3803,9 +3889,7 @@
                 const authors = escapeHtml(p.authors || '');
                 const summary = escapeHtml(p.description || '');
                 const bookmarkHtml = cardUrl
-                    ? `<button class="bookmark-btn" data-url="${escapeForAttr(cardUrl)}" data-title="${escapeForAttr(p.title || '')}" data-source="${publisher}" onclick="toggleGenericBookmark(this)" aria-label="Bookmark paper" title="Bookmark">
-                            <svg viewBox="0 0 24 24"><path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"></path></svg>
-                       </button>`
+                    ? `<button class="bookmark-btn" data-url="${escapeForAttr(cardUrl)}" data-title="${escapeForAttr(p.title || '')}" data-source="${publisher}" data-action="bookmark" aria-label="Bookmark paper" title="Bookmark"></button>`
                     : '';
 
                 html += `
@@ -3880,40 +3964,10 @@
         }
 
         function initYoutubePublisherDropdown() {
-            const list = document.getElementById('youtube-dropdown-list');
-            if (!list) return;
-            list.innerHTML = '';
-            YOUTUBE_PUBLISHERS.forEach(pub => {
-                const item = document.createElement('div');
-                item.className = 'dropdown-item';
-                item.dataset.publisher = pub;
-                const cb = document.createElement('input');
-                cb.type = 'checkbox';
-                cb.id = 'ytpub-' + pub.replace(/\s+/g, '-');
-                cb.dataset.publisher = pub;
-                cb.addEventListener('change', () => onYoutubePublisherChange(pub, cb.checked));
-                const lbl = document.createElement('label');
-                lbl.htmlFor = cb.id;
-                lbl.textContent = pub;
-                item.appendChild(cb);
-                item.appendChild(lbl);
-                item.addEventListener('click', (e) => {
-                    if (e.target !== cb) {
-                        cb.checked = !cb.checked;
-                        onYoutubePublisherChange(pub, cb.checked);
-                    }
-                });
-                list.appendChild(item);
-            });
+            buildDropdownList('youtube-dropdown-list', 'ytpub-', YOUTUBE_PUBLISHERS, onYoutubePublisherChange);
         }
 
-        function toggleYoutubeDropdown() {
-            const dd = document.getElementById('youtube-publisher-dropdown');
-            dd.classList.toggle('open');
-            if (dd.classList.contains('open')) {
-                document.getElementById('youtube-dropdown-search').focus();
-            }
-        }
+        function toggleYoutubeDropdown() { toggleDropdownById('youtube-publisher-dropdown', 'youtube-dropdown-search'); }
 
         function filterYoutubePublisherList() { filterDropdownList('youtube-dropdown-search', 'youtube-dropdown-list'); }
 
@@ -4059,9 +4113,7 @@
                                 <span>${formatYoutubeDate(v.date)}</span>
                             </div>
                         </div>
-                        <button class="bookmark-btn video-bookmark" data-url="${escapeForAttr(bookmarkUrl)}" data-title="${escapeForAttr(v.title)}" data-source="${channel}" onclick="toggleGenericBookmark(this)" aria-label="Bookmark video" title="Bookmark">
-                            <svg viewBox="0 0 24 24"><path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"></path></svg>
-                        </button>
+                        <button class="bookmark-btn video-bookmark" data-url="${escapeForAttr(bookmarkUrl)}" data-title="${escapeForAttr(v.title)}" data-source="${channel}" data-action="bookmark" aria-label="Bookmark video" title="Bookmark"></button>
                     </div>
                 `;
             });
@@ -4090,26 +4142,28 @@
             return badges;
         }
         function toggleTweetExpand(btn) {
-            const textEl = btn.previousElementSibling;
+            const textEl = btn.closest('.tweet-card').querySelector('.tweet-card-body');
             const expanded = textEl.classList.toggle('expanded');
+            const full = textEl.dataset.full || '';
+            textEl.firstElementChild.textContent = expanded ? full : previewText(full, TWEET_PREVIEW_CHARS).text;
             btn.textContent = expanded ? 'Show less' : 'Show more';
         }
-        function checkOverflow(container, textSelector, btnSelector) {
-            if (!container) return;
-            container.querySelectorAll(textSelector).forEach(el => {
-                const btn = el.parentElement.querySelector(btnSelector);
-                if (!btn) return;
-                const clampedH = el.clientHeight;
-                const clone = el.cloneNode(true);
-                clone.classList.add('expanded');
-                clone.style.position = 'absolute';
-                clone.style.visibility = 'hidden';
-                clone.style.width = el.offsetWidth + 'px';
-                el.parentNode.appendChild(clone);
-                const naturalH = clone.scrollHeight;
-                clone.remove();
-                btn.style.display = naturalH > clampedH + 2 ? '' : 'none';
-            });
+        // Cut long card text before it reaches the DOM, so collapsed cards only
+        // lay out what they show and "Show more" appears without measuring.
+        function previewText(raw, maxChars, maxLines) {
+            const full = (raw || '').trim();
+            let text = full;
+            if (maxLines) {
+                const lines = text.split('\n');
+                if (lines.length > maxLines) text = lines.slice(0, maxLines).join('\n');
+            }
+            if (text.length > maxChars) {
+                const cut = text.lastIndexOf(' ', maxChars);
+                text = text.slice(0, cut > maxChars * 0.6 ? cut : maxChars);
+            }
+            text = text.trimEnd();
+            const clipped = text.length < full.length;
+            return { text: clipped ? text + '\u2026' : full, clipped };
         }
 
         // ==================== TWITTER TAB (functions) ====================
@@ -4174,40 +4228,10 @@
         }
 
         function initTwitterPublisherDropdown() {
-            const list = document.getElementById('twitter-dropdown-list');
-            if (!list) return;
-            list.innerHTML = '';
-            TWITTER_PUBLISHERS.forEach(pub => {
-                const item = document.createElement('div');
-                item.className = 'dropdown-item';
-                item.dataset.publisher = pub;
-                const cb = document.createElement('input');
-                cb.type = 'checkbox';
-                cb.id = 'twpub-' + pub.replace(/\s+/g, '-');
-                cb.dataset.publisher = pub;
-                cb.addEventListener('change', () => onTwitterPublisherChange(pub, cb.checked));
-                const lbl = document.createElement('label');
-                lbl.htmlFor = cb.id;
-                lbl.textContent = pub;
-                item.appendChild(cb);
-                item.appendChild(lbl);
-                item.addEventListener('click', (e) => {
-                    if (e.target !== cb) {
-                        cb.checked = !cb.checked;
-                        onTwitterPublisherChange(pub, cb.checked);
-                    }
-                });
-                list.appendChild(item);
-            });
+            buildDropdownList('twitter-dropdown-list', 'twpub-', TWITTER_PUBLISHERS, onTwitterPublisherChange);
         }
 
-        function toggleTwitterDropdown() {
-            const dd = document.getElementById('twitter-publisher-dropdown');
-            dd.classList.toggle('open');
-            if (dd.classList.contains('open')) {
-                document.getElementById('twitter-dropdown-search').focus();
-            }
-        }
+        function toggleTwitterDropdown() { toggleDropdownById('twitter-publisher-dropdown', 'twitter-dropdown-search'); }
 
         function filterTwitterPublisherList() { filterDropdownList('twitter-dropdown-search', 'twitter-dropdown-list'); }
 
@@ -4357,7 +4381,8 @@
                     html += `<h2 class="date-header">${dateHeader}</h2>`;
                 }
 
-                const title = escapeHtml(t.title);
+                const preview = previewText(t.title, TWEET_PREVIEW_CHARS);
+                const title = escapeHtml(preview.text);
                 const source = escapeHtml(t.source);
                 const tweetUrl = sanitizeUrl(t.link || '');
                 const sourceUrl = sanitizeUrl(t.source_url || '') || tweetUrl;
@@ -4393,21 +4418,18 @@
                             </div>
                             <div class="tweet-card-right">
                                 ${t.date ? `<span class="tweet-card-date">${formatTwitterDate(t.date)}</span>` : ''}
-                                <button class="bookmark-btn" data-url="${escapeForAttr(bookmarkUrl)}" data-title="${escapeForAttr(t.title)}" data-source="${source}" onclick="toggleGenericBookmark(this)" aria-label="Bookmark tweet" title="Bookmark">
-                                    <svg viewBox="0 0 24 24"><path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"></path></svg>
-                                </button>
+                                <button class="bookmark-btn" data-url="${escapeForAttr(bookmarkUrl)}" data-title="${escapeForAttr(t.title)}" data-source="${source}" data-action="bookmark" aria-label="Bookmark tweet" title="Bookmark"></button>
                             </div>
                         </div>
-                        <div class="tweet-card-body">${titleHtml}</div>
+                        <div class="tweet-card-body"${preview.clipped ? ` data-full="${escapeForAttr(t.title)}"` : ''}>${titleHtml}</div>
                         ${threadHtml}
-                        <button class="tweet-expand-btn" onclick="toggleTweetExpand(this)">Show more</button>
+                        ${preview.clipped ? '<button class="tweet-expand-btn" data-action="expand-tweet">Show more</button>' : ''}
                         ${t.image ? `<div class="tweet-card-image"><img src="${escapeForAttr(t.image)}" alt="" loading="lazy" onerror="this.parentElement.style.display='none'"></div>` : ''}
                     </div>
                 `;
             });
 
             container.innerHTML = html;
-            requestAnimationFrame(() => checkOverflow(container, '.tweet-card-body', '.tweet-expand-btn'));
             syncBookmarkState();
             renderTwitterPagination(totalPages);
         }
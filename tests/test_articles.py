@@ -3,11 +3,15 @@
 import sys
 import os
 import unittest
+from unittest.mock import patch
 from datetime import datetime, timezone, timedelta
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from articles import clean_html, titles_are_similar, group_similar_articles, normalize_title
+import articles
+from articles import (clean_html, titles_are_similar, group_similar_articles, normalize_title,
+                      get_title_signature,
+                      get_sort_timestamp, to_local_datetime)
 
 
 class TestCleanHtml(unittest.TestCase):
@@ -63,6 +67,30 @@ class TestTitlesSimilar(unittest.TestCase):
         self.assertFalse(titles_are_similar("", ""))
         self.assertFalse(titles_are_similar("Some title", ""))
 
+    def test_length_bound_rejects_without_matcher(self):
+        with patch("articles.SequenceMatcher") as matcher, patch("articles.RAPIDFUZZ_AVAILABLE", False):
+            self.assertFalse(titles_are_similar(
+                "RBI rate cut",
+                "RBI rate cut expected as inflation cools across most states",
+            ))
+        matcher.assert_not_called()
+
+    def test_length_bound_is_exact_at_threshold(self):
+        # 2*3/(3+5) == 0.75: the bound allows it, and "abc" vs "abcde" matches
+        self.assertTrue(titles_are_similar("abc", "abcde"))
+
+    @unittest.skipUnless(articles.RAPIDFUZZ_AVAILABLE, "rapidfuzz not installed")
+    def test_rapidfuzz_prefilter_defers_to_difflib(self):
+        # Indel (LCS) scores this pair 0.762 but difflib only 0.738: two
+        # distinct SEBI orders must not be grouped just because rapidfuzz is there
+        t1 = "SEBI Order in the Matter of Utilis Fund"
+        t2 = "SEBI Order in the Matter of Domus Capital LLP"
+        self.assertGreaterEqual(
+            articles.Indel.normalized_similarity(normalize_title(t1), normalize_title(t2)), 0.75)
+        self.assertFalse(titles_are_similar(t1, t2))
+        with patch("articles.RAPIDFUZZ_AVAILABLE", False):
+            self.assertFalse(titles_are_similar(t1, t2))
+
     def test_prefix_stripped(self):
         # "BREAKING:" prefix should be removed before comparison
         self.assertTrue(titles_are_similar(
@@ -70,6 +98,38 @@ class TestTitlesSimilar(unittest.TestCase):
             "Government announces new trade policy",
         ))
 
+    def test_stacked_prefixes_stripped(self):
+        self.assertEqual(normalize_title("Breaking: Exclusive: RBI cuts rates"), "rbi cuts rates")
+        self.assertTrue(titles_are_similar("Breaking: Exclusive: RBI cuts rates", "RBI cuts rates"))
+
+
+class TestTitleCaches(unittest.TestCase):
+    """normalize_title()/get_title_signature() are memoized per title string."""
+
+    def test_signature_is_cached_and_immutable(self):
+        sig = get_title_signature("Sensex rallies as banks gain")
+        self.assertIs(sig, get_title_signature("Sensex rallies as banks gain"))
+        self.assertEqual(sig, frozenset({"sensex", "rallies", "banks", "gain"}))
+
+    def test_normalize_title_cache_hits(self):
+        normalize_title.cache_clear()
+        normalize_title("Repeat headline")
+        normalize_title("Repeat headline")
+        self.assertEqual(normalize_title.cache_info().hits, 1)
+
+
+class TestToLocalDatetime(unittest.TestCase):
+    def test_aware_datetime_shifted_to_ist(self):
+        dt = datetime(2026, 1, 5, 20, 45, 0, 123456, tzinfo=timezone.utc)
+        local = to_local_datetime(dt)
+        self.assertEqual(local.utcoffset(), timedelta(hours=5, minutes=30))
+        self.assertEqual((local.date().isoformat(), local.strftime("%H:%M:%S.%f")),
+                         ("2026-01-06", "02:15:00.123456"))
+
+    def test_naive_datetime_treated_as_utc(self):
+        self.assertEqual(to_local_datetime(datetime(2026, 1, 5, 0, 0)).hour, 5)
+        self.assertIsNone(to_local_datetime(None))
+
 
 class TestGroupSimilarArticles(unittest.TestCase):
     """Tests for group_similar_articles()."""
@@ -118,6 +178,41 @@ class TestGroupSimilarArticles(unittest.TestCase):
         groups = group_similar_articles(articles)
         self.assertEqual(len(groups), 2)
 
+    def test_identical_titles_coalesced_with_fuzzy_matches(self):
+        articles = [
+            self._make_article("RBI cuts repo rate by 25 basis points", "ET"),
+            self._make_article("Infosys reports strong Q3 earnings", "Mint"),
+            self._make_article("RBI cuts repo rate by 25 bps to 6.25%", "Mint"),
+            self._make_article("RBI cuts repo rate by 25 basis points ", "BS"),
+        ]
+        groups = group_similar_articles(articles)
+        self.assertEqual(len(groups), 2)
+        self.assertEqual(
+            [a["source"] for a in groups[0]["all_articles"]], ["ET", "BS", "Mint"]
+        )
+
+    def test_empty_titles_not_coalesced(self):
+        articles = [self._make_article("", "ET"), self._make_article("", "Mint")]
+        groups = group_similar_articles(articles)
+        self.assertEqual(len(groups), 2)
+
+    def test_only_sort_timestamp_cached_on_articles(self):
+        article = self._make_article("BREAKING: Sensex surges 500 points", "ET")
+        group_similar_articles([article, self._make_article("Rupee slips to record low", "Mint")])
+        self.assertEqual([k for k in article if k.startswith("_")], ["_ts"])
+        self.assertEqual(article["_ts"], article["date"].timestamp())
+        self.assertEqual(get_sort_timestamp(article), article["_ts"])
+
+    def test_undated_sort_timestamp_is_float(self):
+        self.assertIsInstance(get_sort_timestamp({"date": None}), float)
+
+    def test_single_article_bucket_skips_title_work(self):
+        article = self._make_article("Sensex surges 500 points", "ET")
+        with patch("articles.normalize_title") as normalize:
+            groups = group_similar_articles([article])
+        self.assertEqual(groups, [{"primary": article, "related_sources": [], "all_articles": [article]}])
+        normalize.assert_not_called()
+
     def test_empty_list(self):
         groups = group_similar_articles([])
         self.assertEqual(groups, [])
@@ -102,6 +102,27 @@ class TestParseDate(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result.year, 2026)
 
+    def test_rss_gmt_is_utc(self):
+        result = parse_date("Mon, 23 Feb 2026 14:30:00 GMT")
+        self.assertEqual(result.utcoffset().total_seconds(), 0)
+        self.assertEqual(result.hour, 14)
+
+    def test_rbi_naive_rss_gets_ist(self):
+        result = parse_date("Mon, 23 Feb 2026 14:30:00", source_name="RBI Press Releases")
+        self.assertEqual(result.utcoffset().total_seconds(), 5.5 * 3600)
+
+    def test_iso_fractional_seconds(self):
+        result = parse_date("2026-02-23T14:30:00.123+05:30")
+        self.assertEqual(result.microsecond, 123000)
+        self.assertEqual(result.utcoffset().total_seconds(), 5.5 * 3600)
+
+    def test_iso_without_offset_still_rejected(self):
+        self.assertIsNone(parse_date("2026-02-23T14:30:00"))
+
+    def test_sebi_format(self):
+        result = parse_date("02 Feb, 2026 +0530")
+        self.assertEqual((result.day, result.month), (2, 2))
+
     def test_empty_string_returns_none(self):
         self.assertIsNone(parse_date(""))
 
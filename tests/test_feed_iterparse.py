@@ -0,0 +1,44 @@
+"""Tests for streaming feed item parsing."""
+
+import unittest
+from unittest import mock
+
+import feeds
+from feeds import _parse_feed_content
+
+
+LATIN1_FEED = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<rss version="2.0">
+  <channel>
+    <item>
+      <title>Société Générale cuts euro outlook to 1,05 €</title>
+      <link>https://example.com/sg-euro</link>
+      <pubDate>Mon, 12 Oct 2026 08:00:00 +0000</pubDate>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+class TestFeedIterparse(unittest.TestCase):
+    """Validate that decoded feed text parses the same on every backend."""
+
+    def _cfg(self):
+        return {"id": "test-feed", "name": "Test Feed", "url": "https://example.com/"}
+
+    @unittest.skipUnless(feeds.LXML_AVAILABLE, "lxml not installed")
+    def test_lxml_ignores_declared_encoding_of_decoded_text(self):
+        items = _parse_feed_content(LATIN1_FEED, self._cfg())
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items[0]["title"], "Société Générale cuts euro outlook to 1,05 €")
+
+    @unittest.skipUnless(feeds.LXML_AVAILABLE, "lxml not installed")
+    def test_lxml_matches_elementtree(self):
+        lxml_items = _parse_feed_content(LATIN1_FEED, self._cfg())
+        with mock.patch.object(feeds, "LXML_AVAILABLE", False):
+            et_items = _parse_feed_content(LATIN1_FEED, self._cfg())
+        self.assertEqual(lxml_items, et_items)
+
+
+if __name__ == "__main__":
+    unittest.main()
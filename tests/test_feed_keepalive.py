@@ -0,0 +1,99 @@
+"""Unit tests for feeds._fetch_url_bytes: keep-alive pool and 403 fallback."""
+
+import os
+import socket
+import threading
+import unittest
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import feeds
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = []
+
+    def setup(self):
+        super().setup()
+        _Handler.connections.append(self.client_address)
+
+    def do_GET(self):
+        if self.path == "/old":
+            self.send_response(301)
+            self.send_header("Location", "/feed.xml")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/missing":
+            body = b"nope"
+            self.send_response(404)
+        elif self.path.startswith("/waf") and self.headers.get("User-Agent") != "FeedFetcher/1.0":
+            body = b"blocked"
+            self.send_response(403)
+        else:
+            body = b"<rss>" + self.path.encode() + b"</rss>"
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@patch.dict(os.environ, {"http_proxy": "", "HTTP_PROXY": ""}, clear=False)
+class KeepAliveFetchTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _Handler.connections.clear()
+        for key in list(getattr(feeds._KEEPALIVE, "conns", {})):
+            feeds._drop_keepalive(key)
+
+    def test_sequential_fetches_reuse_one_connection(self):
+        self.assertEqual(feeds._fetch_url_bytes(self.base + "/a"), b"<rss>/a</rss>")
+        self.assertEqual(feeds._fetch_url_bytes(self.base + "/b?x=1"), b"<rss>/b?x=1</rss>")
+        self.assertEqual(len(_Handler.connections), 1)
+
+    def test_redirect_is_followed(self):
+        self.assertEqual(feeds._fetch_url_bytes(self.base + "/old"), b"<rss>/feed.xml</rss>")
+
+    def test_http_error_raises_httperror(self):
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            feeds._fetch_url_bytes(self.base + "/missing")
+        self.assertEqual(ctx.exception.code, 404)
+
+    def test_403_retries_with_feed_reader_user_agent(self):
+        self.assertEqual(feeds._fetch_url_bytes(self.base + "/waf"), b"<rss>/waf</rss>")
+
+    def test_403_reraised_when_all_user_agents_blocked(self):
+        with patch.object(feeds, "FEED_FALLBACK_USER_AGENTS", ("Blocked/1.0",)):
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                feeds._fetch_url_bytes(self.base + "/waf")
+        self.assertEqual(ctx.exception.code, 403)
+
+    def test_stale_connection_is_redialed(self):
+        feeds._fetch_url_bytes(self.base + "/a")
+        for conn in feeds._KEEPALIVE.conns.values():
+            conn.sock.shutdown(socket.SHUT_RDWR)  # looks like an idle socket the server closed
+        self.assertEqual(feeds._fetch_url_bytes(self.base + "/c"), b"<rss>/c</rss>")
+
+    def test_connection_refused_raises_urlerror(self):
+        with self.assertRaises(urllib.error.URLError):
+            feeds._fetch_url_bytes("http://127.0.0.1:1/feed.xml", timeout=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
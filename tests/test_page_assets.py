@@ -0,0 +1,117 @@
+"""Tests for stylesheet/script asset handling in aggregator.py."""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import aggregator
+from aggregator import asset_url, minify_css, write_if_changed
+
+
+class TestAssetUrl(unittest.TestCase):
+    def test_appends_content_hash(self):
+        with open(os.path.join(aggregator.SCRIPT_DIR, "templates", "style.css"), "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:10]
+        self.assertEqual(asset_url("templates/style.css"), f"templates/style.css?v={digest}")
+
+    def test_missing_file_returns_plain_path(self):
+        self.assertEqual(asset_url("templates/does-not-exist.css"), "templates/does-not-exist.css")
+
+    def test_page_head_links_versioned_stylesheet(self):
+        self.assertIn(f'<link rel="stylesheet" href="{aggregator.STYLE_CSS_URL}">', aggregator.PAGE_HEAD)
+        self.assertIn("?v=", aggregator.STYLE_CSS_URL)
+        if aggregator.USE_MINIFIED_CSS:
+            self.assertTrue(aggregator.STYLE_CSS_URL.startswith("static/style.min.css?v="))
+
+    def test_stylesheet_preloaded_before_font_css(self):
+        head = aggregator.PAGE_HEAD
+        preload = f'<link rel="preload" href="{aggregator.STYLE_CSS_URL}" as="style">'
+        self.assertIn(preload, head)
+        self.assertLess(head.index(preload), head.index("fonts.googleapis.com/css2"))
+
+    def test_font_css_does_not_block_rendering(self):
+        head = aggregator.PAGE_HEAD
+        font_link = head[head.index("fonts.googleapis.com/css2"):]
+        font_link = font_link[:font_link.index(">")]
+        self.assertIn('media="print"', font_link)
+        self.assertIn("onload=\"this.media='all'\"", font_link)
+
+
+class TestMinifyCss(unittest.TestCase):
+    def test_strips_comments_and_whitespace(self):
+        css = "/* header */\n.a > .b ,\n.c {\n    color : red ;\n    margin: 0;\n}\n"
+        self.assertEqual(minify_css(css), ".a>.b,.c{color :red;margin:0}")
+
+    def test_keeps_strings_and_significant_spaces(self):
+        css = '.x :hover { content: "a  /* b */"; width: calc(100% - 2px); }'
+        self.assertEqual(minify_css(css), '.x :hover{content:"a  /* b */";width:calc(100% - 2px)}')
+
+    def test_drops_leading_zero_of_decimals_only(self):
+        css = ".a { opacity: 0.85; margin: -0.5rem 10.5px; background: rgba(0, 0, 0, 0.4); content: '0.5'; }"
+        self.assertEqual(
+            minify_css(css),
+            ".a{opacity:.85;margin:-0.5rem 10.5px;background:rgba(0,0,0,.4);content:'0.5'}",
+        )
+
+    def test_media_query_spacing_preserved(self):
+        css = "@media (max-width: 640px) and (hover: none) { .y { top: 0; } }"
+        self.assertEqual(minify_css(css), "@media (max-width:640px) and (hover:none){.y{top:0}}")
+
+
+class TestWriteIfChanged(unittest.TestCase):
+    def test_writes_new_and_changed_content_only(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tab.json")
+            self.assertTrue(write_if_changed(path, "[1]"))
+            self.assertFalse(write_if_changed(path, "[1]"))
+            self.assertTrue(write_if_changed(path, "[1,2]"))
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "[1,2]")
+
+
+class TestGeneratedPage(unittest.TestCase):
+    def _generate(self, **kwargs):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "static"))
+            out = os.path.join(tmp, "index.html")
+            with patch.object(aggregator, "SCRIPT_DIR", tmp), \
+                    patch.object(aggregator, "OUTPUT_FILE", out), \
+                    patch.object(aggregator, "write_minified_css"), \
+                    patch("builtins.print"):
+                aggregator.generate_html([], **kwargs)
+            with open(out, encoding="utf-8") as f:
+                page = f.read()
+            with open(os.path.join(tmp, "static", "tab_twitter_hs.json"), encoding="utf-8") as f:
+                high_signal = json.load(f)
+        return page, high_signal
+
+    def test_page_links_versioned_assets(self):
+        page, _ = self._generate()
+        self.assertIn(f'src="{aggregator.APP_JS_URL}"', page)
+        self.assertIn(f'href="{aggregator.STYLE_CSS_URL}"', page)
+        self.assertNotIn("{APP_JS_URL}", page)
+
+    def test_high_signal_tweets_load_from_tab_json(self):
+        tweet = {"title": "Rate cut odds rise", "link": "https://x.com/a/status/1", "source": "Macro"}
+        page, high_signal = self._generate(twitter_high_signal=[tweet])
+        self.assertIn("var TWITTER_HIGH_SIGNAL = null;", page)
+        self.assertNotIn("Rate cut odds rise", page)
+        self.assertEqual([t["link"] for t in high_signal], [tweet["link"]])
+
+    def test_news_paginator_records_shown_page(self):
+        page, _ = self._generate()
+        self.assertIn('id="pagination-bottom" class="pagination bottom" aria-label="Pagination" data-shown="1/1"', page)
+
+    def test_page_sets_pagination_window_boot_var(self):
+        page, _ = self._generate()
+        self.assertIn(f"var PAGINATION_WINDOW = {aggregator.PAGINATION_WINDOW};", page)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""Tests for the server-rendered news paginator in aggregator.py."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aggregator import build_pagination_html
+
+
+class TestBuildPaginationHtml(unittest.TestCase):
+    def test_single_page_renders_nothing(self):
+        self.assertEqual(build_pagination_html(1, 1), "")
+
+    def test_first_page_disables_prev(self):
+        html = build_pagination_html(1, 3)
+        self.assertIn('<button class="page-btn nav prev" disabled>← Prev</button>', html)
+        self.assertIn('<button class="page-btn active">1</button>', html)
+        self.assertIn('<button class="page-btn" data-page="2">2</button>', html)
+        self.assertIn('<button class="page-btn nav next" data-page="2">Next →</button>', html)
+        self.assertNotIn("page-ellipsis", html)
+
+    def test_window_adds_ellipses_on_both_sides(self):
+        html = build_pagination_html(10, 20)
+        self.assertIn('data-page="1">1</button><span class="page-ellipsis">', html)
+        self.assertIn('<button class="page-btn" data-page="7">7</button>', html)
+        self.assertIn('<button class="page-btn" data-page="13">13</button>', html)
+        self.assertNotIn('data-page="6"', html)
+        self.assertIn('</span><button class="page-btn" data-page="20">20</button>', html)
+
+    def test_last_page_disables_next(self):
+        html = build_pagination_html(5, 5)
+        self.assertIn('<button class="page-btn nav next" disabled>Next →</button>', html)
+        self.assertIn('<button class="page-btn active">5</button>', html)
+
+
+if __name__ == "__main__":
+    unittest.main()